@@ -1,46 +1,286 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from PIL import ImageGrab, ImageDraw, ImageFont, Image
+from PIL import ImageGrab, ImageDraw, Image
 import threading
+import queue
 import time
 import os
+import re
+import stat
+import subprocess
+import zlib
 import psutil
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
 import pystray
 from pystray import MenuItem as item, Menu
 import gc
+import io
+try:
+    # mss: 화면 캡처 핸들을 재사용하여 PIL ImageGrab보다 빠르게 캡처 (없으면 ImageGrab 사용)
+    import mss
+    from mss.exception import ScreenShotError
+except ImportError:
+    mss = None
+    ScreenShotError = RuntimeError
+try:
+    # dxcam: Windows Desktop Duplication API로 이미 합성된 화면을 바로 가져옴 (있으면 mss보다 우선 사용)
+    import dxcam
+except ImportError:
+    dxcam = None
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+# Pillow 빌드가 libjpeg-turbo(SIMD JPEG 인코더)를 사용하는지 확인
+try:
+    from PIL import features
+    LIBJPEG_TURBO = bool(features.check('libjpeg_turbo'))
+except Exception:
+    LIBJPEG_TURBO = False
+
+# Pillow가 libjpeg-turbo를 쓰지 않는 경우에만 simplejpeg(libjpeg-turbo SIMD 바인딩)로 JPEG 인코딩
+simplejpeg = None
+if not LIBJPEG_TURBO:
+    try:
+        import numpy as np
+        import simplejpeg
+    except ImportError:
+        simplejpeg = None
+
+# 자동 삭제 대상 이미지 확장자
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.bmp', '.webp')
+
+# 삭제 대상이 이보다 많으면 여러 스레드로 동시에 삭제 (적을 때는 스레드 생성 비용이 더 큼)
+# unlink는 대부분 파일시스템 메타데이터 대기이므로 CPU 수보다 많은 스레드로도 이득이 있음
+PARALLEL_DELETE_THRESHOLD = 1000
+PARALLEL_DELETE_WORKERS = 8
+# 병렬 삭제 시 한 번에 맡기는 파일 수 (작업 객체가 한꺼번에 쌓이지 않고 묶음 사이에 중지 신호 확인)
+DELETE_BATCH_SIZE = 256
+
+# 인코더 스레드 수와 인코딩 대기열 크기 (libjpeg/libwebp는 인코딩 중 GIL을 해제하므로 병렬 처리 가능)
+# 대기열은 스레드당 두 장까지만 허용하여 저장이 밀릴 때 메모리가 계속 늘지 않게 함
+ENCODER_WORKERS = min(3, os.cpu_count() or 1)
+ENCODE_QUEUE_SIZE = ENCODER_WORKERS * 2
+
+# 누적 폴더 크기 보정을 위한 전체 재계산 주기 (초)
+FOLDER_SIZE_RESYNC_SECONDS = 600
+
+# 리소스 모니터 측정 주기 (밀리초, 창이 보일 때 / 트레이로 숨겨져 있을 때)
+RESOURCE_MONITOR_INTERVAL_MS = 1000
+RESOURCE_MONITOR_HIDDEN_INTERVAL_MS = 30000
+
+# 자동 삭제 주기 입력 형식 (양의 정수 또는 소수)
+_CLEAN_NUM = re.compile(r'^[0-9]+(?:\.[0-9]+)?$')
+
+# 인코딩 방식 (JPEG - 빠르게: 허프만 최적화 생략, 균형: 고품질/흑백에서만 최적화, 작게: 항상 최적화)
+ENCODE_MODES = ["빠르게", "균형", "작게"]
+# 인코딩 방식별 WebP method (0~6, 클수록 느리지만 작음 - Pillow 기본값은 4, 컬러/흑백 모두 선택한 품질의 손실 압축)
+WEBP_METHODS = {"빠르게": 0, "균형": 2, "작게": 6}
+
+# 변경 없는 화면 판별용 축소 이미지 크기와, 화면이 그대로여도 한 장은 저장하는 주기 (초)
+FRAME_FINGERPRINT_SIZE = (64, 64)
+UNCHANGED_FRAME_HEARTBEAT_SECONDS = 60
+
+# 타임스탬프 오버레이 폰트 크기와 후보 경로 (전체 경로로 지정하여 Pillow가 폰트 폴더를 검색하지 않게 함)
+OVERLAY_FONT_SIZE = 24
+_WINDOWS_FONT_DIR = os.path.join(os.environ.get('WINDIR', r'C:\Windows'), 'Fonts')
+OVERLAY_FONT_CANDIDATES = [
+    os.path.join(_WINDOWS_FONT_DIR, 'arial.ttf'),
+    os.path.join(_WINDOWS_FONT_DIR, 'malgun.ttf'),
+    '/System/Library/Fonts/Supplemental/Arial.ttf',
+    '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+]
+
+# 스크린샷 파일명 접두사 (screenshot_YYYYMMDD_HHMMSS_mmm.확장자)
+SCREENSHOT_PREFIX = "screenshot_"
+
+# 캡처 상태 라벨 갱신 주기 (밀리초, 캡처 중에만 메인 스레드에서 최신 상태를 읽어 표시)
+STATUS_POLL_MS = 250
+
+
+@functools.lru_cache(maxsize=1)
+def _make_tray_icon():
+    """트레이 아이콘 이미지 생성 (단색 카메라 아이콘, 한 번만 생성)"""
+    icon_image = Image.new('RGB', (64, 64), color=(0, 123, 255))
+    draw = ImageDraw.Draw(icon_image)
+    # 간단한 카메라 아이콘 모양 그리기
+    draw.rectangle([16, 20, 48, 44], fill=(255, 255, 255))
+    draw.rectangle([20, 16, 44, 20], fill=(255, 255, 255))
+    draw.ellipse([22, 26, 30, 34], fill=(0, 0, 0))
+    return icon_image
+
+
+def _du_folder_size_bytes(folder_path):
+    """du -sb로 폴더 크기(바이트) 계산 (GNU du가 없으면 None)"""
+    result = subprocess.run(["du", "-sb", folder_path], capture_output=True, text=True, timeout=30)
+    # 스캔 중 파일이 삭제되면 du가 오류 코드를 반환하지만 합계는 출력됨
+    fields = result.stdout.split()
+    if not fields:
+        return None
+    return int(fields[0])
+
+
+@functools.lru_cache(maxsize=1)
+def _win32_find_api():
+    """FindFirstFileExW/FindNextFileW/FindClose 함수 원형 설정 (한 번만)"""
+    import ctypes
+    from ctypes import wintypes
+
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    find_first = kernel32.FindFirstFileExW
+    find_first.argtypes = [wintypes.LPCWSTR, ctypes.c_int, ctypes.POINTER(wintypes.WIN32_FIND_DATAW),
+                           ctypes.c_int, ctypes.c_void_p, wintypes.DWORD]
+    find_first.restype = wintypes.HANDLE
+    find_next = kernel32.FindNextFileW
+    find_next.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.WIN32_FIND_DATAW)]
+    find_next.restype = wintypes.BOOL
+    find_close = kernel32.FindClose
+    find_close.argtypes = [wintypes.HANDLE]
+    find_close.restype = wintypes.BOOL
+    invalid_handle = ctypes.c_void_p(-1).value
+    return find_first, find_next, find_close, wintypes.WIN32_FIND_DATAW, ctypes.byref, invalid_handle
+
+
+def _win32_folder_size_bytes(folder_path):
+    """FindFirstFileExW로 폴더 크기(바이트) 계산 - 파일 크기를 열거 결과에서 바로 읽어 항목별 stat 호출 없음"""
+    find_first, find_next, find_close, find_data_type, byref, invalid_handle = _win32_find_api()
+    FIND_EX_INFO_BASIC = 1
+    FIND_EX_SEARCH_NAME_MATCH = 0
+    FIND_FIRST_EX_LARGE_FETCH = 2
+    FILE_ATTRIBUTE_DIRECTORY = 0x10
+    FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+
+    total_size = 0
+    data = find_data_type()
+    pending = [folder_path]
+    while pending:
+        path = pending.pop()
+        handle = find_first(os.path.join(path, '*'), FIND_EX_INFO_BASIC, byref(data),
+                            FIND_EX_SEARCH_NAME_MATCH, None, FIND_FIRST_EX_LARGE_FETCH)
+        if handle is None or handle == invalid_handle:
+            # 폴더에 접근할 수 없는 경우 무시
+            continue
+        try:
+            while True:
+                attributes = data.dwFileAttributes
+                if attributes & FILE_ATTRIBUTE_DIRECTORY:
+                    name = data.cFileName
+                    if name not in ('.', '..') and not attributes & FILE_ATTRIBUTE_REPARSE_POINT:
+                        pending.append(os.path.join(path, name))
+                else:
+                    total_size += (data.nFileSizeHigh << 32) | data.nFileSizeLow
+                if not find_next(handle, byref(data)):
+                    break
+        finally:
+            find_close(handle)
+    return total_size
+
+
+# 인코딩된 이미지 파일 쓰기 플래그 (Windows는 O_BINARY가 없으면 줄바꿈 변환이 일어남)
+# O_NOATIME은 넣지 않음 - 접근 시간은 읽기에서만 갱신되므로 쓰기 전용 열기에는 효과가 없음
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+
+def _write_file(filepath, data):
+    """바이트 데이터를 파일로 기록 (파일 객체/버퍼 없이 os.write로 직접 기록)"""
+    fd = os.open(filepath, _WRITE_FLAGS, 0o644)
+    try:
+        written = 0
+        while written < len(data):
+            written += os.write(fd, data[written:])
+    finally:
+        os.close(fd)
+
+
+class SaveStats:
+    """캡처 한 번(시작~정지)의 저장 통계 (캡처/인코더 스레드가 함께 갱신하므로 잠금으로 보호)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.saved = 0  # 실제로 파일로 기록한 장수
+        self.failures = 0  # 저장 실패 장수
+        self.pending = 0  # 대기열에 있거나 인코딩 중인 프레임 수
+
+    def queued(self):
+        """인코더 대기열에 프레임 하나를 넣음"""
+        with self.lock:
+            self.pending += 1
+
+    def dropped(self):
+        """대기열이 가득 차 저장 전에 버린 프레임"""
+        with self.lock:
+            self.pending -= 1
+
+    def done(self, saved):
+        """인코더가 프레임 처리를 마침 (saved: 저장 성공 여부), 누적 실패 장수 반환"""
+        with self.lock:
+            self.pending -= 1
+            if saved:
+                self.saved += 1
+            else:
+                self.failures += 1
+            return self.failures
+
+
+class CaptureSession:
+    """캡처 스레드 하나가 소유하는 화면 캡처 핸들 (스레드 간 공유하지 않고 그 스레드가 끝날 때 정리)"""
+
+    def __init__(self, stats, camera=None):
+        self.stats = stats  # 이 캡처의 저장 통계 (대기열 작업마다 함께 넘겨 정지 후 늦게 끝난 저장도 여기에 집계)
+        self.camera = camera  # dxcam 카메라 (없으면 None)
+        self.sct = None  # mss 핸들 (없으면 None)
+        self.monitor = None  # mss로 캡처할 주 모니터 영역
+        self.last_camera_frame = None  # dxcam이 새 프레임을 주지 않을 때 다시 쓸 마지막 프레임
+
+    def close(self):
+        """열려 있는 캡처 핸들 정리"""
+        if self.sct is not None:
+            self.sct.close()
+            self.sct = None
+        self.monitor = None
+        # dxcam 카메라는 마지막 참조가 사라질 때 스스로 해제됨
+        self.camera = None
+        self.last_camera_frame = None
 
 
 class RollingCleanup:
     """자동 삭제 스레드 클래스 - 10분마다 지정된 시간이 지난 파일 삭제"""
 
-    def __init__(self, save_folder, logger, stop_event, cleanup_age_seconds):
+    def __init__(self, save_folder, logger, stop_event, cleanup_age_seconds, active_ext=None,
+                 size_callback=None):
         self.save_folder = save_folder
         self.cleanup_interval_seconds = 600  # 10분 고정 (600초)
         self.cleanup_age_seconds = cleanup_age_seconds
+        # 로그용 시간 문자열 (삭제 기준이 바뀔 때만 다시 계산)
+        self._age_hours_str = f"{cleanup_age_seconds / 3600:.1f}"
+        # 현재 캡처가 저장하는 확장자 (예: '.jpg'). 다른 확장자 파일이 남아 있을 수 있는 동안은 레거시 모드로 전체 확장자 검사
+        self.active_ext = active_ext
+        self._legacy_mode = True
         self.logger = logger
         self.stop_event = stop_event
+        # 파일 삭제 시 줄어든 크기를 알릴 콜백 (음수 바이트 전달)
+        self.size_callback = size_callback
         self.thread = None
-        self.is_running = False
-        self.file_lock = threading.Lock()
+        # 다음 삭제 예정 시각 (time.time() 기준, UI 카운트다운 표시용)
+        self.next_cleanup_time = None
+        # 변경 없는 폴더의 전체 스캔을 생략하기 위한 캐시
+        self._last_scan_dir_mtime = 0
+        self._earliest_next_expiry = float('inf')
 
     def start(self):
         """정리 스레드 시작"""
-        if self.is_running:
+        if self.thread and self.thread.is_alive():
             return
 
-        self.is_running = True
         # 중지 신호 초기화 (이전 중지 상태 클리어)
         self.stop_event.clear()
+        self.next_cleanup_time = time.time() + self.cleanup_interval_seconds
         self.thread = threading.Thread(target=self._cleanup_worker, daemon=True)
         self.thread.start()
-        cleanup_age_hours = self.cleanup_age_seconds / 3600
-        self.logger.info(f"자동 삭제 스레드 시작됨 (10분마다 {cleanup_age_hours:.1f}시간이 지난 파일 삭제)")
+        self.logger.info(f"자동 삭제 스레드 시작됨 (10분마다 {self._age_hours_str}시간이 지난 파일 삭제)")
 
     def stop(self):
         """정리 스레드 중지"""
-        self.is_running = False
         # 중지 신호를 먼저 설정하여 스레드가 즉시 반응하도록 함
         self.stop_event.set()
 
@@ -53,27 +293,29 @@ class RollingCleanup:
 
     def update_cleanup_age(self, new_cleanup_age_seconds):
         """삭제 주기(age)를 동적으로 업데이트"""
+        # 입력창 키 입력마다 호출되므로 값이 실제로 바뀔 때만 스캔 캐시를 비우고 기록
+        if new_cleanup_age_seconds == self.cleanup_age_seconds:
+            return
         self.cleanup_age_seconds = new_cleanup_age_seconds
-        cleanup_age_hours = self.cleanup_age_seconds / 3600
-        self.logger.info(f"자동 삭제 주기가 {cleanup_age_hours:.1f}시간으로 업데이트되었습니다.")
+        # 삭제 기준이 바뀌었으므로 다음 주기에 반드시 다시 스캔
+        self._last_scan_dir_mtime = 0
+        self._age_hours_str = f"{new_cleanup_age_seconds / 3600:.1f}"
+        self.logger.info(f"자동 삭제 주기가 {self._age_hours_str}시간으로 업데이트되었습니다.")
+
+    def set_active_ext(self, active_ext):
+        """캡처 저장 확장자 변경 (이전 포맷 파일 정리를 위해 레거시 모드로 전환)"""
+        if active_ext != self.active_ext:
+            self.active_ext = active_ext
+            self._legacy_mode = True
+            self._last_scan_dir_mtime = 0
 
     def _cleanup_worker(self):
         """정리 작업자 스레드"""
-        while self.is_running and not self.stop_event.is_set():
+        while not self.stop_event.is_set():
             try:
-                # 설정된 주기만큼 대기 (1초 단위로 나누어 중지 신호 확인 - 응답성 향상)
-                remaining_time = self.cleanup_interval_seconds
-                check_interval = 1  # 1초마다 중지 신호 확인 (기존 10초에서 개선)
-
-                while remaining_time > 0 and self.is_running and not self.stop_event.is_set():
-                    sleep_time = min(check_interval, remaining_time)
-                    # time.sleep 대신 stop_event.wait 사용으로 즉시 중단 가능
-                    if self.stop_event.wait(timeout=sleep_time):
-                        # 중지 신호가 왔으면 즉시 종료
-                        break
-                    remaining_time -= sleep_time
-
-                if not self.is_running or self.stop_event.is_set():
+                # 설정된 주기만큼 대기 (중지 신호가 오면 wait가 즉시 반환되므로 별도 폴링 불필요)
+                self.next_cleanup_time = time.time() + self.cleanup_interval_seconds
+                if self.stop_event.wait(timeout=self.cleanup_interval_seconds):
                     break
 
                 # 지정된 시간이 지난 파일 삭제 실행
@@ -82,11 +324,8 @@ class RollingCleanup:
             except Exception as e:
                 self.logger.error(f"정리 스레드 오류: {str(e)}")
                 # 오류 발생 시 최대 3초 대기 후 재시도 (중지 신호 확인하며)
-                for _ in range(3):
-                    if not self.is_running or self.stop_event.is_set():
-                        return
-                    if self.stop_event.wait(timeout=1.0):  # 1초 대기, 중지 신호 확인
-                        return
+                if self.stop_event.wait(timeout=3.0):  # 중지 신호가 오면 즉시 반환
+                    return
 
     def _perform_rolling_cleanup(self):
         """지정된 시간이 지난 파일만 삭제"""
@@ -96,51 +335,136 @@ class RollingCleanup:
             current_time = time.time()
             cutoff_time = current_time - self.cleanup_age_seconds # 설정된 시간 사용
 
-            cleanup_age_hours = self.cleanup_age_seconds / 3600
-            self.logger.info(f"자동 삭제 시작 - {cleanup_age_hours:.1f}시간이 지난 파일을 스캔하여 삭제합니다...")
+            # 폴더 자체의 수정 시간이 그대로이고 만료될 파일도 없으면 스캔 생략
+            try:
+                dir_mtime = os.stat(self.save_folder).st_mtime
+            except OSError as e:
+                self.logger.error(f"폴더 상태 확인 실패: {str(e)}")
+                return
+            if dir_mtime == self._last_scan_dir_mtime and current_time < self._earliest_next_expiry:
+                self.logger.debug("자동 삭제 생략: 마지막 스캔 이후 폴더 변경 없음")
+                return
 
-            # 파일 시스템 작업 시 락 획득
-            with self.file_lock:
-                try:
-                    # os.scandir()를 사용하여 폴더를 효율적으로 스캔
-                    with os.scandir(self.save_folder) as entries:
-                        for entry in entries:
-                            if not self.is_running or self.stop_event.is_set():
-                                break
+            self.logger.info(f"자동 삭제 시작 - {self._age_hours_str}시간이 지난 파일을 스캔하여 삭제합니다...")
+
+            # 반복문에서 자주 쓰는 메서드를 지역 변수로 캐시 (반복마다 속성 조회 생략)
+            stopped = self.stop_event.is_set
+            safe_delete = self._safe_delete_file
+            debug = self.logger.debug
+            warning = self.logger.warning
+
+            # 1단계: 폴더를 한 번 스캔하여 삭제 대상만 수집 (이미지 확장자 확인 후에만 stat 호출)
+            old_paths = []
+            oldest_kept_mtime = float('inf')
+            # 확장자 검사 방식은 스캔마다 한 번만 결정
+            active_ext = self.active_ext
+            legacy_mode = self._legacy_mode or not active_ext
+            legacy_kept = False
+            scan_completed = False
+            try:
+                with os.scandir(self.save_folder) as entries:
+                    for entry in entries:
+                        if stopped():
+                            break
 
-                            # 이미지 파일만 처리
-                            if not entry.name.lower().endswith(('.jpg', '.jpeg', '.png', '.bmp', '.webp')):
-                                self.logger.debug(f"건너뜀 (이미지 파일 아님): {entry.name}")
+                        # 일반 이미지 파일만 처리 (is_file은 scandir가 읽어둔 파일 종류 정보를 재사용)
+                        try:
+                            if not entry.is_file(follow_symlinks=False):
+                                continue
+                        except OSError:
+                            continue
+                        name = entry.name
+                        if legacy_mode:
+                            if not name.lower().endswith(IMAGE_EXTENSIONS):
                                 continue
+                        elif not name.endswith(active_ext):
+                            # 캡처가 파일명을 직접 만들므로 소문자 변환 없이 단일 확장자만 비교
+                            continue
 
-                            # 중지 신호 확인 (파일 처리 전에)
-                            if not self.is_running or self.stop_event.is_set():
-                                break
+                        try:
+                            # Windows에서는 scandir 결과에 캐시된 정보를 그대로 사용 (추가 시스템 호출 없음)
+                            file_stat = entry.stat(follow_symlinks=False)
+                            file_mtime = file_stat.st_mtime
+                            if file_mtime < cutoff_time:
+                                old_paths.append((name, entry.path, file_stat.st_size))
+                            else:
+                                if file_mtime < oldest_kept_mtime:
+                                    # 남는 파일 중 가장 오래된 수정 시간만 기록 (만료 시각은 스캔 후 한 번만 계산)
+                                    oldest_kept_mtime = file_mtime
+                                if legacy_mode and active_ext and not legacy_kept and not name.endswith(active_ext):
+                                    legacy_kept = True
+                        except OSError as e:
+                            warning(f"파일 처리 중 오류 ({name}): {str(e)}")
+                            failed_count += 1
+                    else:
+                        scan_completed = True
+            except OSError as e:
+                self.logger.error(f"폴더 스캔 실패: {str(e)}")
+                return
 
-                            try:
-                                # 파일 수정 시간 확인
-                                file_mtime = entry.stat().st_mtime
-
-                                # 지정된 시간이 지났는지 확인
-                                if file_mtime < cutoff_time:
-                                    # 안전한 삭제 시도
-                                    if self._safe_delete_file(entry.path):
-                                        deleted_count += 1
-                                        self.logger.debug(f"삭제됨: {entry.name}")
-                                    else:
-                                        failed_count += 1
-                                        self.logger.warning(f"삭제 실패: {entry.name}")
-
-                                # 중지 신호 확인 (더 빈번한 확인으로 응답성 향상)
-                                if not self.is_running or self.stop_event.is_set():
-                                    break
-
-                            except (OSError, FileNotFoundError) as e:
-                                self.logger.warning(f"파일 처리 중 오류 ({entry.name}): {str(e)}")
-                                failed_count += 1
+            # 2단계: 스캔이 끝난 후 삭제 (반복 중 폴더 변경 방지)
+            # dir_fd를 지원하는 OS에서는 폴더를 한 번만 열어 파일명 기준으로 삭제 (매번 전체 경로 해석 생략)
+            dir_fd = None
+            if old_paths and os.unlink in os.supports_dir_fd:
+                try:
+                    dir_fd = os.open(self.save_folder, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0))
                 except OSError as e:
-                    self.logger.error(f"폴더 스캔 실패: {str(e)}")
-                    return
+                    self.logger.debug(f"폴더 디스크립터 열기 실패 - 경로 기반 삭제 사용: {str(e)}")
+
+            def delete(victim):
+                # 중지 신호가 이미 설정되었으면 건너뜀 (None)
+                if stopped():
+                    return None
+                name, file_path, _ = victim
+                return safe_delete(file_path, dir_fd=dir_fd, name=name)
+
+            try:
+                if len(old_paths) > PARALLEL_DELETE_THRESHOLD:
+                    # 삭제는 시스템 호출 대기 시간이 대부분이므로 여러 건을 동시에 진행
+                    # (각 작업은 시작 시 중지 신호를 확인하므로 중지 시 남은 작업은 바로 반환)
+                    results = []
+                    with ThreadPoolExecutor(max_workers=PARALLEL_DELETE_WORKERS) as executor:
+                        for start in range(0, len(old_paths), DELETE_BATCH_SIZE):
+                            if stopped():
+                                break
+                            results.extend(executor.map(delete, old_paths[start:start + DELETE_BATCH_SIZE]))
+                else:
+                    results = []
+                    for victim in old_paths:
+                        # 중지 신호 확인
+                        if stopped():
+                            break
+                        results.append(delete(victim))
+
+                deleted_bytes = 0
+                for (name, _, file_size), deleted in zip(old_paths, results):
+                    if deleted is None:
+                        continue
+                    if deleted:
+                        deleted_count += 1
+                        deleted_bytes += file_size
+                        debug(f"삭제됨: {name}")
+                    else:
+                        failed_count += 1
+                        warning(f"삭제 실패: {name}")
+                if deleted_bytes and self.size_callback is not None:
+                    self.size_callback(-deleted_bytes)
+            finally:
+                if dir_fd is not None:
+                    os.close(dir_fd)
+
+            # 스캔이 끝까지 완료되고 실패한 파일이 없을 때만 캐시 갱신
+            # (삭제로 폴더가 바뀌었으면 다음 주기에 한 번 더 스캔됨)
+            # 스캔 중 저장 포맷이 바뀌었으면 레거시 모드를 유지해야 하므로 캐시도 갱신하지 않음
+            if (scan_completed and failed_count == 0 and deleted_count == len(old_paths)
+                    and self.active_ext == active_ext):
+                self._last_scan_dir_mtime = dir_mtime
+                self._earliest_next_expiry = oldest_kept_mtime + self.cleanup_age_seconds
+                # 다른 확장자 파일이 더 이상 남아 있지 않으면 단일 확장자 비교로 전환
+                if legacy_mode and active_ext and not legacy_kept:
+                    self._legacy_mode = False
+            else:
+                self._last_scan_dir_mtime = 0
 
             # 결과 로깅
             if deleted_count > 0 or failed_count > 0:
@@ -151,22 +475,38 @@ class RollingCleanup:
         except Exception as e:
             self.logger.error(f"자동 삭제 중 오류: {str(e)}")
 
-    def _safe_delete_file(self, file_path, max_retries=3, retry_delay=1):
-        """안전한 파일 삭제"""
+    def _safe_delete_file(self, file_path, max_retries=3, initial_delay=0.01, dir_fd=None, name=None):
+        """안전한 파일 삭제 (dir_fd와 name이 주어지면 폴더 디스크립터 기준으로 삭제)"""
+        # 재시도 반복에서 쓰는 함수를 지역 변수로 캐시
+        stopped = self.stop_event.is_set
+        wait = self.stop_event.wait
+        unlink = os.unlink
+
         for attempt in range(max_retries):
             # 중지 신호 확인
-            if not self.is_running or self.stop_event.is_set():
+            if stopped():
                 return False
 
             try:
                 # 파일 삭제 시도
-                os.remove(file_path)
+                if dir_fd is not None:
+                    unlink(name, dir_fd=dir_fd)
+                else:
+                    unlink(file_path)
                 return True
-            except (OSError, FileNotFoundError, PermissionError) as e: # PermissionError 추가
+            except FileNotFoundError:
+                # 이미 다른 곳에서 삭제된 파일은 재시도 없이 삭제된 것으로 처리
+                return True
+            except (IsADirectoryError, NotADirectoryError) as e:
+                # 기다려도 풀리지 않는 오류는 재시도하지 않음
+                self.logger.warning(f"파일 삭제 실패: {os.path.basename(file_path)} - {str(e)}")
+                return False
+            except OSError as e:  # PermissionError(Windows 공유 위반 등 일시적 잠금) 포함
                 if attempt < max_retries - 1:
                     self.logger.debug(f"삭제 재시도 {attempt + 1}/{max_retries}: {os.path.basename(file_path)} - {str(e)}")
-                    # 중지 신호 대기 (응답성 향상)
-                    if self.stop_event.wait(timeout=retry_delay):
+                    # 지수 백오프 (10ms부터 두 배씩, 최대 0.5초) - 백신 검사 등 일시적 잠금에 빠르게 대응
+                    delay = min(0.5, initial_delay * (1 << attempt))
+                    if wait(timeout=delay):
                         return False
                     continue
                 else:
@@ -174,12 +514,6 @@ class RollingCleanup:
                     return False
         return False
 
-    def _is_file_locked(self, file_path):
-        """파일이 다른 프로세스에서 사용 중인지 확인 (사용되지 않음)"""
-        # 이 함수는 더 이상 사용되지 않지만, 호환성을 위해 남겨둘 수 있습니다.
-        # 실제로는 _safe_delete_file의 예외 처리로 대체되었습니다.
-        return False
-
 
 class ScreenCapture:
     def __init__(self):
@@ -194,6 +528,17 @@ class ScreenCapture:
         # 캡처 상태 관리
         self.is_capturing = False
         self.capture_thread = None
+        # 현재(또는 마지막) 캡처의 저장 통계 - 캡처를 시작할 때마다 새로 만듦
+        self._save_stats = SaveStats()
+        # 캡처/인코더 스레드가 남긴 최신 상태 문구 - 메인 스레드가 저장 장수와 함께 주기적으로 읽어 표시
+        self._status_cell = None
+        self._shown_status = None
+        self.status_poll_job = None
+
+        # 캡처 스레드와 인코더 스레드 사이의 저장 대기열
+        # (원본 이미지, 경로, 오버레이 시간, 목표 해상도, 흑백 여부, 포맷, 품질, JPEG 인코딩 방식)
+        self._encode_queue = queue.Queue(maxsize=ENCODE_QUEUE_SIZE)
+        self._encoder_threads = []
         
         # 캡처 간격 설정 (초)
         self.capture_interval = tk.DoubleVar(value=2.0)
@@ -203,18 +548,33 @@ class ScreenCapture:
         self.rolling_cleanup_age_value = tk.DoubleVar(value=24.0) # 삭제 주기 값 (기본 24시간)
         self.rolling_cleanup_age_unit = tk.StringVar(value="시간") # 삭제 주기 단위
 
+        # 유휴 시점에 일괄 적용할 위젯 설정 변경 (위젯 -> config 인자)
+        self._pending_updates = {}
+        self._ui_flush_scheduled = False
+
         # 유효성 검사 진행 상태 플래그 (팝업 중복 방지)
         self._validation_in_progress = False
+        self._cleanup_debounce_job = None  # 자동 삭제 설정 입력 지연 적용 작업 ID
         self.rolling_cleanup = None  # RollingCleanup 인스턴스
         self.cleanup_timer_job = None # 타이머 작업을 위한 변수
         
         # 프로그램 리소스 모니터링
         self.resource_monitor_enabled = tk.BooleanVar(value=True)
-        self.resource_monitor_thread = None
-        self.current_process = None
-
-        # 파일 시스템 작업 동기화를 위한 락
-        self.file_lock = threading.Lock()
+        self.folder_size_enabled = tk.BooleanVar(value=True)  # 폴더 크기 측정 여부
+        self.resource_monitor_job = None  # root.after 작업 ID
+        # 현재 프로세스 정보는 한 번만 생성하고 CPU 측정 기준점을 미리 잡아 둠
+        try:
+            self.current_process = psutil.Process(os.getpid())
+            self.current_process.cpu_percent(interval=None)
+            self.logger.info(f"프로그램 PID: {os.getpid()}")
+        except Exception as e:
+            self.current_process = None
+            self.logger.error(f"프로세스 정보 가져오기 실패: {str(e)}")
+        # 저장 폴더 크기 누적값 (None이면 아직 전체 계산 전) 및 마지막 전체 계산 시각
+        self._folder_size_bytes = None
+        self._folder_size_synced_at = 0
+        self._folder_size_lock = threading.Lock()
+        self._folder_size_thread = None
 
         # 스레드 종료 신호
         self.stop_event = threading.Event()
@@ -223,20 +583,52 @@ class ScreenCapture:
         self.tray_icon = None
         self.tray_thread = None
 
-        # 이미지 설정
+        # 이미지 설정 (Pillow 또는 Pillow-SIMD 모두 PIL 이름으로 import됨)
+        jpeg_encoder = 'libjpeg-turbo' if LIBJPEG_TURBO else 'simplejpeg' if simplejpeg is not None else 'libjpeg'
+        self.logger.info(f"JPEG 인코더: {jpeg_encoder}")
         self.image_format = tk.StringVar(value="JPEG")  # "JPEG" 또는 "WEBP"
         self.image_quality = tk.IntVar(value=15)  # 1-100
         self.image_quality_value = tk.DoubleVar(value=15.0)  # Scale용 실수 값
         self.image_resolution = tk.StringVar(value="원본")  # 해상도 설정
         self.image_grayscale = tk.BooleanVar(value=False)  # 흑백 변환 설정
+        self.encode_mode = tk.StringVar(value="균형")  # JPEG/WebP 인코딩 방식
+        self.skip_unchanged = tk.BooleanVar(value=False)  # 변경 없는 화면 저장 생략
+
+        # 캡처 설정 스냅샷 (Tk 변수는 메인 스레드에서만 읽고 캡처 스레드는 이 튜플만 사용)
+        self._capture_settings = None
+        for var in (self.capture_interval, self.image_format, self.image_quality,
+                    self.image_resolution, self.image_grayscale, self.encode_mode,
+                    self.skip_unchanged):
+            var.trace_add('write', self._snapshot_capture_settings)
+        self._snapshot_capture_settings()
+        # 캡처 중에도 포맷을 바꿀 수 있으므로 자동 삭제 대상 확장자도 바로 갱신
+        self.image_format.trace_add('write', self._on_image_format_changed)
+
+        # 타임스탬프 오버레이 폰트 (시작 시간을 줄이기 위해 첫 오버레이 때 한 번만 로드)
+        self._overlay_font = None
+        self._overlay_box = None  # 배경 영역 좌표 (paste용)
+        self._overlay_text_pos = None  # 배경 영역 안의 텍스트 시작 좌표
+        self._overlay_text_cache = None  # (시간 문자열, 글자 마스크) - 초가 바뀔 때만 다시 그림
+        self._overlay_dim_mask = None  # 반투명 검은 배경용 균일 알파(180) 마스크
 
         # 저장 폴더 설정
         self.save_folder = "screenshots"
-        if not os.path.exists(self.save_folder):
-            os.makedirs(self.save_folder)
+        os.makedirs(self.save_folder, exist_ok=True)
+        # 경로 표시용 절대 경로 캐시 (save_folder 변경 시에만 갱신)
+        self._abs_save_folder = os.path.abspath(self.save_folder)
 
         self.setup_ui()
 
+        # 캡처 중 잠그는 위젯과 (잠금 상태, 해제 상태) - 시작/정지 시 위젯당 config 한 번
+        self._capture_widgets = [
+            (self.interval_entry, 'readonly', 'normal'),
+            (self.apply_button, 'disabled', 'normal'),
+            (self.path_button, 'disabled', 'normal'),
+            (self.cleanup_checkbox, 'disabled', 'normal'),
+            (self.cleanup_age_entry, 'readonly', 'normal'),
+            (self.cleanup_unit_combo, 'disabled', 'readonly'),
+        ]
+
         # 리소스 모니터링 시작
         self.start_resource_monitoring()
 
@@ -265,12 +657,13 @@ class ScreenCapture:
         class DateRotatingFileHandler(logging.FileHandler):
             def __init__(self, filename, encoding=None):
                 self.base_filename = filename
-                self.current_date = self._get_current_date()
+                self._next_rollover = self._compute_next_rollover()
                 super().__init__(self._get_full_filename(), encoding=encoding)
 
-            def _get_current_date(self):
-                now = datetime.now()
-                return now.strftime("%Y%m%d")
+            def _compute_next_rollover(self):
+                # 다음 날 자정(로컬 시간)의 Unix 타임스탬프
+                tomorrow = datetime.now().date() + timedelta(days=1)
+                return time.mktime(tomorrow.timetuple())
 
             def _get_full_filename(self):
                 now = datetime.now()
@@ -282,15 +675,31 @@ class ScreenCapture:
                 return os.path.join(log_dir, f"{day}.log")
 
             def emit(self, record):
-                # 날짜가 바뀌었는지 확인
-                current_date = self._get_current_date()
-                if current_date != self.current_date:
-                    # 날짜가 바뀌었으면 파일 핸들러 교체
-                    self.current_date = current_date
+                # 날짜가 바뀌었는지 확인 (레코드 생성 시각과 숫자 비교만 수행)
+                if record.created >= self._next_rollover:
+                    # 날짜가 바뀌었으면 버퍼에 남은 이전 날짜 기록을 먼저 디스크로 내보낸 뒤 파일 핸들러 교체
+                    self._next_rollover = self._compute_next_rollover()
+                    self.flush()
                     self.close()
                     self.baseFilename = self._get_full_filename()
-                    self.stream = open(self.baseFilename, self.mode, encoding=self.encoding)
-                super().emit(record)
+                    self.stream = self._open()
+                if record.levelno >= logging.WARNING:
+                    # 경고/오류는 바로 디스크에 기록 (비정상 종료 시에도 남도록)
+                    super().emit(record)
+                    return
+                # INFO 이하는 버퍼에만 쓰고 flush 생략 - 버퍼가 차거나 경고 기록/종료 시 한 번에 기록
+                try:
+                    # 닫힌 뒤(종료 중, 교체 실패 후 등)에 온 기록은 FileHandler.emit과 같은 방식으로 다시 엶
+                    if self.stream is None:
+                        if self.mode != 'w' or not getattr(self, '_closed', False):
+                            self.stream = self._open()
+                        else:
+                            return
+                    self.stream.write(self.format(record) + self.terminator)
+                except RecursionError:
+                    raise
+                except Exception:
+                    self.handleError(record)
 
         logging.basicConfig(
             level=logging.INFO,
@@ -303,54 +712,25 @@ class ScreenCapture:
         self.logger = logging.getLogger(__name__)
         self.logger.info("프로그램 시작됨")
     
-    def is_file_locked(self, file_path):
-        """파일이 다른 프로세스에서 사용 중인지 확인"""
-        try:
-            # 파일을 배타적 모드로 열어보기
-            with open(file_path, 'r+b') as f:
-                return False
-        except (IOError, OSError):
-            return True
-    
     def safe_delete_file(self, file_path, max_retries=3, retry_delay=1):
         """안전한 파일 삭제 (재시도 로직 포함)"""
         for attempt in range(max_retries):
             try:
-                # 파일 잠금 상태 확인
-                if self.is_file_locked(file_path):
-                    if attempt < max_retries - 1:
-                        self.logger.warning(f"파일이 사용 중입니다. 재시도 {attempt + 1}/{max_retries}: {file_path}")
-                        time.sleep(retry_delay)
-                        continue
-                    else:
-                        self.logger.error(f"파일 삭제 실패 (최대 재시도 초과): {file_path}")
-                        return False
-                
-                # 파일 삭제 시도
+                # 사용 중인 파일은 삭제 시도 자체가 실패하므로 별도 잠금 확인 없이 바로 삭제
                 os.remove(file_path)
-                self.logger.info(f"파일 삭제 성공: {file_path}")
+                self.logger.debug(f"파일 삭제 성공: {file_path}")
                 return True
-                
             except FileNotFoundError:
                 self.logger.warning(f"파일이 이미 존재하지 않음: {file_path}")
                 return True  # 이미 삭제된 상태로 간주
-            except PermissionError:
-                if attempt < max_retries - 1:
-                    self.logger.warning(f"권한 오류로 재시도 {attempt + 1}/{max_retries}: {file_path}")
-                    time.sleep(retry_delay)
-                    continue
-                else:
-                    self.logger.error(f"권한 오류로 파일 삭제 실패: {file_path}")
-                    return False
-            except Exception as e:
+            except OSError as e:
                 if attempt < max_retries - 1:
-                    self.logger.warning(f"예상치 못한 오류로 재시도 {attempt + 1}/{max_retries}: {file_path} - {str(e)}")
+                    self.logger.warning(f"파일 삭제 재시도 {attempt + 1}/{max_retries}: {file_path} - {str(e)}")
                     time.sleep(retry_delay)
                     continue
-                else:
-                    self.logger.error(f"파일 삭제 실패: {file_path} - {str(e)}")
-                    return False
-        
+                self.logger.error(f"파일 삭제 실패: {file_path} - {str(e)}")
+                return False
+
         return False
     
     def setup_ui(self):
@@ -401,7 +781,7 @@ class ScreenCapture:
         path_control_frame.pack(fill=tk.X, pady=5)
         
         # 현재 경로 표시
-        self.path_label = ttk.Label(path_control_frame, text=f"현재 경로: {os.path.abspath(self.save_folder)}", 
+        self.path_label = ttk.Label(path_control_frame, text=f"현재 경로: {self._abs_save_folder}", 
                                    font=("Arial", 9), foreground="blue")
         self.path_label.pack(anchor=tk.W, pady=(0, 5))
         
@@ -460,6 +840,12 @@ class ScreenCapture:
                                                variable=self.resource_monitor_enabled,
                                                command=self.toggle_resource_monitoring)
         self.resource_checkbox.pack(anchor=tk.W, pady=(0, 5))
+
+        # 폴더 크기 측정 체크박스 (끄면 폴더 스캔을 하지 않음)
+        self.folder_size_checkbox = ttk.Checkbutton(resource_frame, text="폴더 크기 측정",
+                                                  variable=self.folder_size_enabled,
+                                                  command=self.toggle_folder_size)
+        self.folder_size_checkbox.pack(anchor=tk.W, pady=(0, 5))
         
         # 리소스 정보 표시 프레임
         resource_info_frame = ttk.Frame(resource_frame)
@@ -503,12 +889,22 @@ class ScreenCapture:
         quality_label = ttk.Label(quality_frame, textvariable=self.image_quality)
         quality_label.pack(side=tk.LEFT, padx=(5, 0))
 
+        # 인코딩 방식 설정 프레임 (인코딩 속도와 파일 크기 선택)
+        encode_mode_frame = ttk.Frame(image_frame)
+        encode_mode_frame.pack(fill=tk.X, pady=5)
+
+        ttk.Label(encode_mode_frame, text="인코딩:").pack(side=tk.LEFT, padx=(0, 5))
+        encode_mode_combo = ttk.Combobox(encode_mode_frame, textvariable=self.encode_mode,
+                                        values=ENCODE_MODES, state="readonly", width=8)
+        encode_mode_combo.pack(side=tk.LEFT, padx=(0, 5))
+
         # 해상도 설정 프레임
         resolution_frame = ttk.Frame(image_frame)
         resolution_frame.pack(fill=tk.X, pady=5)
 
         ttk.Label(resolution_frame, text="해상도:").pack(side=tk.LEFT, padx=(0, 5))
-        resolutions = ["원본", "1920x1080", "1280x720", "1024x768", "800x600"]
+        # 1/2, 1/4: 원본 해상도를 정수배로 축소 (모니터 크기와 상관없이 픽셀 수를 4배/16배 줄임)
+        resolutions = ["원본", "1/2", "1/4", "1920x1080", "1280x720", "1024x768", "800x600"]
         resolution_combo = ttk.Combobox(resolution_frame, textvariable=self.image_resolution,
                                        values=resolutions, state="readonly", width=12)
         resolution_combo.pack(side=tk.LEFT, padx=(0, 5))
@@ -521,6 +917,11 @@ class ScreenCapture:
                                                  variable=self.image_grayscale)
         self.grayscale_checkbox.pack(anchor=tk.W)
 
+        # 변경 없는 화면 건너뛰기 (이전 캡처와 같은 화면이면 인코딩/저장 생략)
+        self.skip_unchanged_checkbox = ttk.Checkbutton(grayscale_frame, text="변경 없는 화면 건너뛰기",
+                                                      variable=self.skip_unchanged)
+        self.skip_unchanged_checkbox.pack(anchor=tk.W)
+
         # 상태 표시
         self.status_label = ttk.Label(main_frame, text="대기 중...",
                                      font=("Arial", 10))
@@ -560,60 +961,44 @@ class ScreenCapture:
                 # 콜백에서 호출된 경우 파라미터 값 사용
                 current_value = float(value)
 
-            # 실수 값을 정수로 변환
+            # 실수 값을 정수로 변환 (드래그 중 정수 값이 바뀔 때만 갱신하여 표시/설정 스냅샷 갱신 최소화)
             int_value = int(current_value)
-            self.image_quality.set(int_value)
+            if int_value != self.image_quality.get():
+                self.image_quality.set(int_value)
         except (ValueError, TypeError):
             # 변환 실패 시 현재 값 유지
             pass
 
     def create_tray_menu(self):
-        """동적으로 트레이 메뉴 생성"""
-        menu_items = []
-
-        # 화면 모니터링 표시 메뉴 (항상 활성화)
-        menu_items.append(item('화면 모니터링 표시', self.show_window))
-
-        # 모니터링 시작 메뉴 (캡처 중이 아닐 때만 활성화)
-        if not self.is_capturing:
-            menu_items.append(item('▶ 모니터링 시작', self.start_capture_from_tray))
-        else:
-            # 캡처 중일 때는 상태 표시 (클릭 불가)
-            menu_items.append(item('⏸ 모니터링 시작 (실행 중)', None))
-
-        # 모니터링 정지 메뉴 (캡처 중일 때만 활성화)
-        if self.is_capturing:
-            menu_items.append(item('⏹ 모니터링 정지', self.stop_capture_from_tray))
-        else:
-            # 캡처 중이 아닐 때는 상태 표시 (클릭 불가)
-            menu_items.append(item('⏸ 모니터링 정지 (정지됨)', None))
-
-        # 종료 메뉴 (항상 활성화)
-        menu_items.append(item('종료', self.quit_program))
-
-        # pystray.Menu 객체로 반환
-        return Menu(*menu_items)
+        """트레이 메뉴 생성 (한 번만 생성, 캡처 상태에 따른 라벨/활성화는 콜백으로 평가)"""
+        return Menu(
+            # 화면 모니터링 표시 메뉴 (항상 활성화)
+            item('화면 모니터링 표시', self.show_window),
+            # 모니터링 시작 메뉴 (캡처 중이 아닐 때만 활성화)
+            item(lambda _: '⏸ 모니터링 시작 (실행 중)' if self.is_capturing else '▶ 모니터링 시작',
+                 self.start_capture_from_tray,
+                 enabled=lambda _: not self.is_capturing),
+            # 모니터링 정지 메뉴 (캡처 중일 때만 활성화)
+            item(lambda _: '⏹ 모니터링 정지' if self.is_capturing else '⏸ 모니터링 정지 (정지됨)',
+                 self.stop_capture_from_tray,
+                 enabled=lambda _: self.is_capturing),
+            # 종료 메뉴 (항상 활성화)
+            item('종료', self.quit_program)
+        )
 
     def update_tray_menu(self):
-        """트레이 메뉴 업데이트"""
+        """트레이 메뉴 상태 갱신 (메뉴를 새로 만들지 않고 라벨/활성화만 다시 평가)"""
         try:
             if self.tray_icon:
-                # 새로운 메뉴로 설정
-                new_menu = self.create_tray_menu()
-                self.tray_icon.menu = new_menu
+                self.tray_icon.update_menu()
         except Exception as e:
             self.logger.error(f"트레이 메뉴 업데이트 실패: {str(e)}")
 
     def setup_system_tray(self):
         """시스템 트레이 설정"""
         try:
-            # 트레이 아이콘 이미지 생성 (단색 아이콘)
-            icon_image = Image.new('RGB', (64, 64), color=(0, 123, 255))
-            draw = ImageDraw.Draw(icon_image)
-            # 간단한 카메라 아이콘 모양 그리기
-            draw.rectangle([16, 20, 48, 44], fill=(255, 255, 255))
-            draw.rectangle([20, 16, 44, 20], fill=(255, 255, 255))
-            draw.ellipse([22, 26, 30, 34], fill=(0, 0, 0))
+            # 트레이 아이콘 이미지 (캐시된 이미지 재사용)
+            icon_image = _make_tray_icon()
 
             # 시스템 트레이 아이콘 생성 (초기 메뉴 설정)
             self.tray_icon = pystray.Icon(
@@ -635,6 +1020,8 @@ class ScreenCapture:
         self.root.deiconify()
         self.root.lift()
         self.root.focus_force()
+        # 숨김 상태에서 느려진 리소스 측정 주기를 바로 복구
+        self.refresh_resource_monitor()
 
     def hide_window(self):
         """GUI 창 숨김"""
@@ -654,6 +1041,20 @@ class ScreenCapture:
             # 트레이 메뉴 업데이트
             self.update_tray_menu()
     
+    def _queue_ui_update(self, widget, **kwargs):
+        """위젯 설정 변경을 모아 두었다가 유휴 시점에 한 번에 적용"""
+        self._pending_updates.setdefault(widget, {}).update(kwargs)
+        if not self._ui_flush_scheduled:
+            self._ui_flush_scheduled = True
+            self.root.after_idle(self._flush_ui)
+
+    def _flush_ui(self):
+        """대기 중인 위젯 설정 변경 적용 (위젯당 config 한 번)"""
+        self._ui_flush_scheduled = False
+        pending, self._pending_updates = self._pending_updates, {}
+        for widget, kwargs in pending.items():
+            widget.config(**kwargs)
+
     def validate_interval(self, event=None):
         """간격 입력값 실시간 검증"""
         try:
@@ -661,15 +1062,15 @@ class ScreenCapture:
             if value:  # 빈 문자열이 아닌 경우에만 검증
                 interval = float(value)
                 if 0.1 <= interval <= 3600:
-                    self.interval_entry.config(foreground="black")
-                    self.interval_info.config(text="범위: 0.1 ~ 3600초 (1시간)", foreground="gray")
+                    self._queue_ui_update(self.interval_entry, foreground="black")
+                    self._queue_ui_update(self.interval_info, text="범위: 0.1 ~ 3600초 (1시간)", foreground="gray")
                 else:
-                    self.interval_entry.config(foreground="red")
-                    self.interval_info.config(text="❌ 범위를 벗어남: 0.1 ~ 3600초", foreground="red")
+                    self._queue_ui_update(self.interval_entry, foreground="red")
+                    self._queue_ui_update(self.interval_info, text="❌ 범위를 벗어남: 0.1 ~ 3600초", foreground="red")
         except ValueError:
             if self.interval_entry.get():  # 빈 문자열이 아닌 경우에만 에러 표시
-                self.interval_entry.config(foreground="red")
-                self.interval_info.config(text="❌ 숫자만 입력하세요", foreground="red")
+                self._queue_ui_update(self.interval_entry, foreground="red")
+                self._queue_ui_update(self.interval_info, text="❌ 숫자만 입력하세요", foreground="red")
     
     def apply_interval(self):
         """간격 설정 적용"""
@@ -677,13 +1078,13 @@ class ScreenCapture:
             value = float(self.interval_entry.get())
             if 0.1 <= value <= 3600:
                 self.capture_interval.set(value)
-                self.interval_info.config(text=f"✅ {value}초로 설정됨", foreground="green")
-                self.root.after(2000, lambda: self.interval_info.config(
-                    text="범위: 0.1 ~ 3600초 (1시간)", foreground="gray"))
+                self._queue_ui_update(self.interval_info, text=f"✅ {value}초로 설정됨", foreground="green")
+                self.root.after(2000, lambda: self._queue_ui_update(
+                    self.interval_info, text="범위: 0.1 ~ 3600초 (1시간)", foreground="gray"))
             else:
-                self.interval_info.config(text="❌ 범위를 벗어남: 0.1 ~ 3600초", foreground="red")
+                self._queue_ui_update(self.interval_info, text="❌ 범위를 벗어남: 0.1 ~ 3600초", foreground="red")
         except ValueError:
-            self.interval_info.config(text="❌ 올바른 숫자를 입력하세요", foreground="red")
+            self._queue_ui_update(self.interval_info, text="❌ 올바른 숫자를 입력하세요", foreground="red")
     
     def select_save_path(self):
         """저장 경로 선택"""
@@ -695,11 +1096,14 @@ class ScreenCapture:
         if new_path:  # 사용자가 경로를 선택한 경우
             try:
                 # 선택한 경로가 존재하지 않으면 생성
-                if not os.path.exists(new_path):
-                    os.makedirs(new_path)
+                os.makedirs(new_path, exist_ok=True)
                 
                 # 경로 업데이트
                 self.save_folder = new_path
+                self._abs_save_folder = os.path.abspath(new_path)
+                # 새 폴더 크기는 다음 모니터링 주기에 전체 계산
+                with self._folder_size_lock:
+                    self._folder_size_bytes = None
                 self.update_path_label()
                 
                 # 성공 메시지
@@ -711,7 +1115,7 @@ class ScreenCapture:
 
     def update_path_label(self):
         """경로 라벨 업데이트"""
-        abs_path = os.path.abspath(self.save_folder)
+        abs_path = self._abs_save_folder
         # 경로가 너무 길면 줄임
         if len(abs_path) > 50:
             display_path = "..." + abs_path[-47:]
@@ -722,56 +1126,40 @@ class ScreenCapture:
     
     def validate_cleanup_interval(self):
         """자동 삭제 주기 유효성 검사"""
-        try:
-            # Tkinter DoubleVar에서 가져온 값 처리 (숫자나 문자열일 수 있음)
-            raw_value = self.rolling_cleanup_age_value.get()
+        # Tcl 실수 변환(DoubleVar.get) 대신 입력 문자열을 직접 검사하여 예외 경로를 피함
+        value_str = self.cleanup_age_entry.get().strip()
+        unit = self.rolling_cleanup_age_unit.get()
 
-            # 숫자 타입이면 문자열로 변환
-            if isinstance(raw_value, (int, float)):
-                value_str = str(raw_value)
-            else:
-                value_str = raw_value
+        # 빈 문자열이나 공백만 있는 경우 체크
+        if not value_str:
+            self.show_cleanup_warning("삭제 주기를 입력해주세요. 숫자만 입력 가능합니다.")
+            return False
 
-            unit = self.rolling_cleanup_age_unit.get()
+        # 숫자 형식이 아니면 실수 변환 없이 바로 거부
+        if not _CLEAN_NUM.match(value_str):
+            self.show_cleanup_warning("유효한 숫자를 입력해주세요. 예: 30, 2.5")
+            return False
+        value = float(value_str)
 
-            # 빈 문자열이나 공백만 있는 경우 체크
-            if not value_str or (isinstance(value_str, str) and value_str.strip() == ""):
-                self.show_cleanup_warning("삭제 주기를 입력해주세요. 숫자만 입력 가능합니다.")
-                return False
+        # 값이 0인 경우 체크
+        if value <= 0:
+            self.show_cleanup_warning("삭제 주기는 0보다 큰 값을 입력해주세요.")
+            return False
 
-            # 문자열을 실수로 변환
-            try:
-                value = float(value_str)
-            except (ValueError, TypeError):
-                self.show_cleanup_warning("유효한 숫자를 입력해주세요. 예: 30, 2.5")
+        if unit == "분":
+            # 1분 ~ 60분 (1시간)
+            if not (1 <= value <= 60):
+                self.show_cleanup_warning("삭제 주기는 1분에서 60분(1시간) 사이로 설정해야 합니다.")
                 return False
-
-            # 값이 0이거나 음수인 경우 체크
-            if value <= 0:
-                self.show_cleanup_warning("삭제 주기는 0보다 큰 값을 입력해주세요.")
+        elif unit == "시간":
+            # 1시간 ~ 525600시간(365일)
+            if not (1 <= value <= 525600):
+                self.show_cleanup_warning("삭제 주기는 1시간에서 525600시간(365일) 사이로 설정해야 합니다.")
                 return False
 
-            if unit == "분":
-                # 1분 ~ 60분 (1시간)
-                if not (1 <= value <= 60):
-                    self.show_cleanup_warning("삭제 주기는 1분에서 60분(1시간) 사이로 설정해야 합니다.")
-                    return False
-            elif unit == "시간":
-                # 1시간 ~ 525600시간(365일)
-                if not (1 <= value <= 525600):
-                    self.show_cleanup_warning("삭제 주기는 1시간에서 525600시간(365일) 사이로 설정해야 합니다.")
-                    return False
-
-            # 유효성 검사 통과 시 경고 메시지 제거
-            self.clear_cleanup_warning()
-            return True
-        except Exception as e:
-            # Tkinter TclError 등 모든 예외 처리
-            if "_tkinter.TclError" in str(type(e)) or "expected floating-point number" in str(e):
-                self.show_cleanup_warning("삭제 주기를 입력해주세요. 숫자만 입력 가능합니다.")
-            else:
-                self.show_cleanup_warning(f"입력값 오류: {str(e)}")
-            return False
+        # 유효성 검사 통과 시 경고 메시지 제거
+        self.clear_cleanup_warning()
+        return True
 
     def show_cleanup_warning(self, message):
         """삭제 주기 경고 메시지 표시"""
@@ -784,7 +1172,15 @@ class ScreenCapture:
             self.cleanup_warning_label.config(text="")
 
     def apply_cleanup_settings_immediately(self, event=None):
-        """시간/단위 변경 시 자동 삭제 설정 즉시 적용"""
+        """시간/단위 변경 시 자동 삭제 설정 적용 (입력이 멈춘 뒤 250ms 후 한 번만 실행)"""
+        if self._cleanup_debounce_job:
+            self.root.after_cancel(self._cleanup_debounce_job)
+        self._cleanup_debounce_job = self.root.after(250, self._apply_cleanup_settings_real)
+
+    def _apply_cleanup_settings_real(self):
+        """자동 삭제 설정 유효성 검사 후 적용"""
+        self._cleanup_debounce_job = None
+
         # 자동 삭제가 활성화되어 있지 않으면 무시
         if not self.rolling_cleanup_enabled.get():
             return
@@ -821,7 +1217,9 @@ class ScreenCapture:
                 self.save_folder,
                 self.logger,
                 self.stop_event,
-                cleanup_age_seconds
+                cleanup_age_seconds,
+                self.get_active_ext(),
+                self.add_folder_size
             )
             self.rolling_cleanup.start()
         else:
@@ -857,7 +1255,9 @@ class ScreenCapture:
                     self.save_folder,
                     self.logger,
                     self.stop_event,
-                    cleanup_age_seconds
+                    cleanup_age_seconds,
+                    self.get_active_ext(),
+                    self.add_folder_size
                 )
                 self.rolling_cleanup.start()
             else:
@@ -881,9 +1281,9 @@ class ScreenCapture:
         # 기존 타이머가 있다면 취소
         if self.cleanup_timer_job:
             self.root.after_cancel(self.cleanup_timer_job)
-        
-        # 10분(600초) 타이머 시작
-        self.update_cleanup_timer(600)
+            self.cleanup_timer_job = None
+
+        self.update_cleanup_timer()
 
     def stop_cleanup_timer(self):
         """삭제 주기 타이머 중지"""
@@ -892,20 +1292,29 @@ class ScreenCapture:
             self.cleanup_timer_job = None
         self.next_cleanup_label.config(text="다음 삭제까지: --")
 
-    def update_cleanup_timer(self, remaining_seconds):
-        """타이머 라벨을 1초마다 업데이트"""
-        if remaining_seconds > 0:
+    def update_cleanup_timer(self):
+        """타이머 라벨 업데이트 (1분 넘게 남으면 분 단위, 마지막 1분은 1초마다)"""
+        # 남은 시간은 삭제 스레드가 기록한 실제 예정 시각에서 계산 (UI와 실제 삭제 시점이 어긋나지 않도록)
+        next_time = self.rolling_cleanup.next_cleanup_time if self.rolling_cleanup is not None else None
+        remaining_seconds = int(-(-(next_time - time.time()) // 1)) if next_time is not None else 0
+        if remaining_seconds > 60:
+            # 남은 분만 표시하고 다음 분 경계까지 한 번에 대기 (불필요한 1초 주기 깨어남 제거)
+            mins = -(-remaining_seconds // 60)
+            self.next_cleanup_label.config(text=f"다음 삭제까지: {mins:02d}분")
+            step = remaining_seconds - (mins - 1) * 60
+            self.cleanup_timer_job = self.root.after(step * 1000, self.update_cleanup_timer)
+        elif remaining_seconds > 0:
             mins, secs = divmod(remaining_seconds, 60)
             timer_text = f"다음 삭제까지: {mins:02d}분 {secs:02d}초"
             self.next_cleanup_label.config(text=timer_text)
             
             # 1초 후에 다시 이 함수를 호출
-            self.cleanup_timer_job = self.root.after(1000, self.update_cleanup_timer, remaining_seconds - 1)
+            self.cleanup_timer_job = self.root.after(1000, self.update_cleanup_timer)
         else:
             self.next_cleanup_label.config(text="삭제 작업 실행 중...")
-            
-            # 삭제 작업이 끝난 후 다시 타이머 시작 (약 5초 후)
-            self.cleanup_timer_job = self.root.after(5000, self.start_cleanup_timer)
+
+            # 삭제 스레드가 다음 예정 시각을 기록할 때까지 1초마다 확인
+            self.cleanup_timer_job = self.root.after(1000, self.update_cleanup_timer)
 
     def toggle_resource_monitoring(self):
         """리소스 모니터링 토글"""
@@ -914,103 +1323,150 @@ class ScreenCapture:
         else:
             self.stop_resource_monitoring()
     
+    def toggle_folder_size(self):
+        """폴더 크기 측정 토글 (바로 다시 표시)"""
+        self.refresh_resource_monitor()
+
     def start_resource_monitoring(self):
         """프로그램 리소스 모니터링 시작"""
-        if not self.resource_monitor_enabled.get():
+        if not self.resource_monitor_enabled.get() or self.current_process is None:
             return
         
-        # 현재 프로세스 정보 초기화
-        try:
-            self.current_process = psutil.Process(os.getpid())
-            self.logger.info(f"프로그램 PID: {os.getpid()}")
-        except Exception as e:
-            self.logger.error(f"프로세스 정보 가져오기 실패: {str(e)}")
-            return
-        
-        if self.resource_monitor_thread is None or not self.resource_monitor_thread.is_alive():
-            self.resource_monitor_thread = threading.Thread(target=self.resource_monitor_worker, daemon=True)
-            self.resource_monitor_thread.start()
+        if self.resource_monitor_job is None:
+            # 모니터링이 꺼져 있던 동안의 CPU 시간이 첫 측정값에 섞이지 않도록 기준점 재설정
+            self.current_process.cpu_percent(interval=None)
+            self.resource_monitor_job = self.root.after(0, self.resource_monitor_tick)
             self.logger.info("프로그램 리소스 모니터링 시작")
     
     def stop_resource_monitoring(self):
         """프로그램 리소스 모니터링 중지"""
         self.resource_monitor_enabled.set(False)
-        self.root.after(0, self.clear_resource_display)
+        if self.resource_monitor_job:
+            self.root.after_cancel(self.resource_monitor_job)
+            self.resource_monitor_job = None
+        self.clear_resource_display()
         self.logger.info("프로그램 리소스 모니터링 중지")
     
-    def resource_monitor_worker(self):
-        """프로그램 리소스 모니터링 작업자"""
-        last_folder_size_check_time = 0
-        folder_size_mb = 0
-        folder_size_check_interval = 30  # 30초
+    def refresh_resource_monitor(self):
+        """대기 중인 리소스 측정을 취소하고 즉시 다시 측정 (창을 다시 표시할 때)"""
+        if self.resource_monitor_job:
+            self.root.after_cancel(self.resource_monitor_job)
+            self.resource_monitor_job = self.root.after(0, self.resource_monitor_tick)
+
+    def resource_monitor_tick(self):
+        """프로그램 리소스 모니터링 (메인 스레드에서 root.after로 주기 실행)"""
+        self.resource_monitor_job = None
+        if not self.resource_monitor_enabled.get():
+            return
+
+        # 창이 보일 때와 트레이로 숨겨져 있을 때 측정 주기를 다르게 적용
+        delay_ms = RESOURCE_MONITOR_HIDDEN_INTERVAL_MS if self.root.state() == 'withdrawn' else RESOURCE_MONITOR_INTERVAL_MS
+        try:
+            # oneshot: 같은 프로세스 정보 조회를 한 번으로 묶음 (플랫폼에 따라 시스템 호출 감소)
+            with self.current_process.oneshot():
+                # 현재 프로그램의 CPU 사용률 (이전 측정 이후 사용률 - 블로킹 없음)
+                cpu_percent = self.current_process.cpu_percent(interval=None)
 
-        while self.resource_monitor_enabled.get() and not self.stop_event.is_set():
-            try:
-                if self.current_process is None:
-                    # 프로세스가 없으면 재초기화 시도
-                    try:
-                        self.current_process = psutil.Process(os.getpid())
-                    except Exception as e:
-                        self.logger.error(f"프로세스 재초기화 실패: {str(e)}")
-                        time.sleep(5)
-                        continue
-                
-                # 현재 프로그램의 CPU 사용률 (1초 간격으로 측정)
-                cpu_percent = self.current_process.cpu_percent(interval=1)
-                
                 # 현재 프로그램의 메모리 사용량
                 memory_info = self.current_process.memory_info()
-                memory_mb = memory_info.rss / (1024 * 1024)  # RSS(물리 메모리)를 MB로 변환
-                
-                # 스크린샷 폴더 크기 계산 (30초마다)
-                current_time = time.time()
-                if current_time - last_folder_size_check_time > folder_size_check_interval:
-                    folder_size_mb = self.get_folder_size_mb(self.save_folder)
-                    last_folder_size_check_time = current_time
-                
-                # GUI 업데이트
-                self.root.after(0, self.update_resource_display, cpu_percent, memory_mb, folder_size_mb)
-                
-                # 1초 대기 (CPU 측정에서 이미 1초 간격 있으므로 추가 대기 없음)
-                
-            except psutil.NoSuchProcess:
-                self.logger.error("프로세스가 존재하지 않습니다")
-                break
-            except psutil.AccessDenied:
-                self.logger.error("프로세스 접근이 거부되었습니다")
-                time.sleep(5)
-            except Exception as e:
-                self.logger.error(f"프로그램 리소스 모니터링 오류: {str(e)}")
-                time.sleep(5)  # 오류 발생 시 5초 대기 후 재시도
+            memory_mb = memory_info.rss / (1024 * 1024)  # RSS(물리 메모리)를 MB로 변환
+
+            # 스크린샷 폴더 크기 (누적값이라 매번 읽어도 비용이 없음, 측정이 꺼져 있으면 폴더를 스캔하지 않음)
+            folder_size_mb = None
+            if self.folder_size_enabled.get():
+                folder_size_mb = self.get_folder_size_mb(self.save_folder)
+
+            # GUI 업데이트 (이미 메인 스레드이므로 직접 호출)
+            self.update_resource_display(cpu_percent, memory_mb, folder_size_mb)
+
+        except psutil.NoSuchProcess:
+            self.logger.error("프로세스가 존재하지 않습니다")
+            return
+        except psutil.AccessDenied:
+            self.logger.error("프로세스 접근이 거부되었습니다")
+            delay_ms = 5000
+        except Exception as e:
+            self.logger.error(f"프로그램 리소스 모니터링 오류: {str(e)}")
+            delay_ms = 5000  # 오류 발생 시 5초 대기 후 재시도
+
+        self.resource_monitor_job = self.root.after(delay_ms, self.resource_monitor_tick)
     
     def get_folder_size_mb(self, folder_path):
-        """폴더 크기를 MB 단위로 계산 (os.scandir 사용)"""
-        total_size = 0
+        """폴더 크기를 MB 단위로 반환 (캡처/삭제 시 누적한 값 사용, 처음과 일정 주기마다만 전체 계산)"""
+        with self._folder_size_lock:
+            tracked_size = self._folder_size_bytes
+            synced_at = self._folder_size_synced_at
 
-        def calculate_size_recursive(path):
-            nonlocal total_size
-            try:
-                with os.scandir(path) as entries:
-                    for entry in entries:
-                        try:
-                            if entry.is_file():
-                                total_size += entry.stat().st_size
-                            elif entry.is_dir():
-                                calculate_size_recursive(entry.path)
-                        except (OSError, FileNotFoundError):
-                            # 파일이 삭제되었거나 접근할 수 없는 경우 무시
-                            pass
-            except (PermissionError, FileNotFoundError):
-                # 폴더에 접근할 수 없는 경우 무시
-                pass
+        if tracked_size is None or time.monotonic() - synced_at > FOLDER_SIZE_RESYNC_SECONDS:
+            # 전체 계산은 오래 걸릴 수 있으므로 별도 스레드에서 실행 (UI 멈춤 방지)
+            self.start_folder_size_resync(folder_path)
+
+        return (tracked_size or 0) / (1024 * 1024)  # 바이트를 MB로 변환
+
+    def start_folder_size_resync(self, folder_path):
+        """폴더 전체 크기 재계산 스레드 시작 (이미 실행 중이면 무시)"""
+        if self._folder_size_thread is not None and self._folder_size_thread.is_alive():
+            return
 
+        def resync():
+            measured_size = self._measure_folder_size_bytes(folder_path)
+            with self._folder_size_lock:
+                self._folder_size_bytes = measured_size
+                self._folder_size_synced_at = time.monotonic()
+
+        self._folder_size_thread = threading.Thread(target=resync, daemon=True)
+        self._folder_size_thread.start()
+
+    def add_folder_size(self, delta_bytes):
+        """캡처 저장(+)/자동 삭제(-) 시 누적 폴더 크기 갱신"""
+        with self._folder_size_lock:
+            if self._folder_size_bytes is not None:
+                self._folder_size_bytes = max(0, self._folder_size_bytes + delta_bytes)
+
+    def _measure_folder_size_bytes(self, folder_path):
+        """폴더 전체 크기를 바이트 단위로 계산 (OS가 한 번에 계산, 실패 시 os.scandir 사용)"""
+        total_size = None
         try:
-            calculate_size_recursive(folder_path)
+            if os.name == 'nt':
+                total_size = _win32_folder_size_bytes(folder_path)
+            else:
+                total_size = _du_folder_size_bytes(folder_path)
         except Exception as e:
-            self.logger.warning(f"폴더 크기 계산 오류: {str(e)}")
-            return 0
+            self.logger.debug(f"OS 폴더 크기 계산 실패 - os.scandir 사용: {str(e)}")
 
-        return total_size / (1024 * 1024)  # 바이트를 MB로 변환
+        if total_size is None:
+            try:
+                total_size = self._scan_folder_size_bytes(folder_path)
+            except Exception as e:
+                self.logger.warning(f"폴더 크기 계산 오류: {str(e)}")
+                return 0
+
+        return total_size
+
+    def _scan_folder_size_bytes(self, path):
+        """os.scandir로 폴더 크기(바이트) 계산 (재귀 대신 스택 사용, 파일만 stat 한 번)"""
+        total_size = 0
+        pending_dirs = [path]
+        while pending_dirs:
+            try:
+                entries = os.scandir(pending_dirs.pop())
+            except OSError:
+                # 폴더에 접근할 수 없거나 삭제된 경우 무시
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        # 폴더 여부는 디렉터리 목록에 포함된 종류 정보로 판단 (stat 호출 없음)
+                        if entry.is_dir(follow_symlinks=False):
+                            pending_dirs.append(entry.path)
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        # 파일이 삭제되었거나 접근할 수 없는 경우 무시
+                        continue
+                    if stat.S_ISREG(st.st_mode):
+                        total_size += st.st_size
+        return total_size
     
     def update_resource_display(self, cpu_percent, memory_mb, folder_size_mb):
         """프로그램 리소스 사용률 표시 업데이트"""
@@ -1025,8 +1481,11 @@ class ScreenCapture:
         memory_color = "red" if memory_mb > 500 else "orange" if memory_mb > 200 else "blue"
         self.memory_label.config(text=f"메모리: {memory_mb:.1f}MB", foreground=memory_color)
         
-        # 폴더 크기 색상 설정
-        if folder_size_mb > 1000:  # 1GB 이상
+        # 폴더 크기 색상 설정 (None이면 측정 비활성)
+        if folder_size_mb is None:
+            folder_color = "gray"
+            folder_text = "폴더크기: 비활성"
+        elif folder_size_mb > 1000:  # 1GB 이상
             folder_color = "red"
             folder_text = f"폴더크기: {folder_size_mb/1024:.1f}GB"
         elif folder_size_mb > 500:  # 500MB 이상
@@ -1045,47 +1504,114 @@ class ScreenCapture:
         self.disk_label.config(text="폴더크기: --", foreground="gray")
     
         
-    def add_timestamp_overlay(self, image):
-        """이미지에 현재 시간 오버레이 추가"""
-        # 이미지 복사본 생성
-        img_with_text = image.copy()
-        draw = ImageDraw.Draw(img_with_text)
-        
-        # 현재 시간 텍스트 생성
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        # 폰트 설정 (시스템 기본 폰트 사용)
-        try:
-            # Windows 기본 폰트 시도
-            font = ImageFont.truetype("arial.ttf", 24)
-        except:
+    def _load_overlay_font(self):
+        """타임스탬프 오버레이 폰트 로드 (시스템 기본 폰트 사용)"""
+        # 폰트 모듈은 첫 캡처 때만 필요하므로 여기서 가져옴
+        from PIL import ImageFont
+        for font_path in OVERLAY_FONT_CANDIDATES:
             try:
-                # 다른 폰트 시도
-                font = ImageFont.truetype("malgun.ttf", 24)
-            except:
-                # 기본 폰트 사용
-                font = ImageFont.load_default()
-        
-        # 텍스트 크기 계산
-        bbox = draw.textbbox((0, 0), current_time, font=font)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
-        
-        # 배경 사각형 좌표 (패딩 포함)
-        padding = 10
-        x1, y1 = 10, 10
-        x2, y2 = x1 + text_width + (padding * 2), y1 + text_height + (padding * 2)
-        
-        # 반투명 검은색 배경 그리기
-        draw.rectangle([x1, y1, x2, y2], fill=(0, 0, 0, 180))
-        
-        # 흰색 텍스트 그리기
-        text_x = x1 + padding
-        text_y = y1 + padding
-        draw.text((text_x, text_y), current_time, fill=(255, 255, 255), font=font)
-        
-        return img_with_text
+                return ImageFont.truetype(font_path, OVERLAY_FONT_SIZE)
+            except OSError:
+                # 없는 폰트는 다음 후보 시도
+                continue
+        # 기본 폰트 사용
+        self.logger.warning("오버레이 폰트를 찾지 못해 기본 폰트 사용")
+        return ImageFont.load_default()
+
+    def add_timestamp_overlay(self, image, current_time=None):
+        """이미지에 현재 시간 오버레이 추가 (복사본 없이 캐시한 마스크로 시간 영역에만 직접 합성)"""
+        if self._overlay_font is None:
+            # 시간 문자열은 항상 같은 형식이므로 배경/텍스트 좌표도 폰트와 함께 한 번만 계산
+            font = self._load_overlay_font()
+            bbox = font.getbbox("0000-00-00 00:00:00")
+            padding = 10
+            x1, y1 = 10, 10
+            x2 = x1 + (bbox[2] - bbox[0]) + (padding * 2)
+            y2 = y1 + (bbox[3] - bbox[1]) + (padding * 2)
+            self._overlay_box = (x1, y1, x2 + 1, y2 + 1)
+            self._overlay_text_pos = (padding, padding)
+            self._overlay_dim_mask = Image.new('L', (x2 + 1 - x1, y2 + 1 - y1), 180)
+            self._overlay_font = font
+
+        # 현재 시간 텍스트 생성 (호출한 쪽에서 만든 문자열이 있으면 그대로 사용)
+        if current_time is None:
+            current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        # 흑백(L) 이미지는 단일 채널 값으로 그림
+        if image.mode == 'L':
+            background, foreground = 0, 255
+        else:
+            background, foreground = (0, 0, 0), (255, 255, 255)
+
+        # 반투명 검은 배경 (알파 180) - 시간 영역에만 제자리 합성
+        box = self._overlay_box
+        image.paste(background, box, self._overlay_dim_mask)
+
+        # 글자 모양은 시간 문자열이 바뀔 때만 마스크로 그려 두고 (같은 초의 프레임은 재사용)
+        # 인코더 스레드끼리 공유하므로 문자열과 마스크를 튜플 하나로 교체
+        cached = self._overlay_text_cache
+        if cached is None or cached[0] != current_time:
+            mask = Image.new('L', self._overlay_dim_mask.size, 0)
+            ImageDraw.Draw(mask).text(self._overlay_text_pos, current_time, fill=255, font=self._overlay_font)
+            cached = (current_time, mask)
+            self._overlay_text_cache = cached
+
+        # 글자 마스크 모양대로 흰색 합성
+        image.paste(foreground, box, cached[1])
+
+        return image
     
+    def resize_image(self, image, target_size):
+        """비율을 유지하며 목표 해상도 이내로 축소"""
+        width, height = target_size
+        src_width, src_height = image.size
+
+        # 원본이 목표 해상도의 정수배이면 reduce() 박스 필터 사용 (일반 resize보다 훨씬 빠름)
+        if src_width > width and src_width % width == 0 and src_height % height == 0:
+            factor = src_width // width
+            if src_height // height == factor:
+                return image.reduce(factor)
+
+        # 축소 전용이므로 면적 평균(BOX) 필터 사용 - OpenCV INTER_AREA와 같은 방식으로,
+        # 3픽셀 커널의 LANCZOS보다 연산이 훨씬 적고 화면 글자도 뭉개지지 않음
+        # (BOX는 한 번에 정확히 평균을 내므로 reduce() 선행 단계는 끔)
+        image.thumbnail((width, height), Image.BOX, reducing_gap=None)
+        return image
+
+    def _parse_resolution(self, resolution):
+        """해상도 설정 해석 (원본: None, 1/N: 축소 배율 정수, WxH: 목표 크기 튜플)"""
+        if resolution == "원본":
+            return None
+        if resolution.startswith("1/"):
+            return int(resolution[2:])
+        return tuple(map(int, resolution.split('x')))
+
+    def _snapshot_capture_settings(self, *args):
+        """캡처 설정을 일반 튜플로 복사 (설정 변경 시 메인 스레드에서 호출)"""
+        try:
+            self._capture_settings = (
+                self.capture_interval.get(),
+                self.image_format.get(),
+                self.get_active_ext(),
+                self.image_quality.get(),
+                self._parse_resolution(self.image_resolution.get()),
+                self.image_grayscale.get(),
+                self.encode_mode.get(),
+                self.skip_unchanged.get(),
+            )
+        except (tk.TclError, ValueError):
+            # 입력 중인 간격 값처럼 아직 숫자가 아니면 이전 설정 유지
+            pass
+
+    def _on_image_format_changed(self, *args):
+        """저장 포맷 변경 시 자동 삭제 스레드에 새 확장자 전달 (이전 포맷 파일도 계속 정리되도록)"""
+        if self.rolling_cleanup is not None:
+            self.rolling_cleanup.set_active_ext(self.get_active_ext())
+
+    def get_active_ext(self):
+        """현재 이미지 포맷의 저장 확장자"""
+        return ".webp" if self.image_format.get() == "WEBP" else ".jpg"
+
     def get_system_status(self):
         """시스템 상태 정보 수집"""
         try:
@@ -1099,105 +1625,459 @@ class ScreenCapture:
             disk_info = f"디스크: {disk.percent:.1f}% 사용 ({disk.free//1024//1024//1024}GB 사용가능)"
 
             return f"{memory_info}, {disk_info}"
-        except:
+        except Exception:
             return "시스템 상태 확인 불가"
 
-    def capture_screen(self):
-        """화면 모니터링 함수"""
-        capture_count = 0
-        
+    def start_encoders(self):
+        """인코더 스레드 시작 (종료된 스레드만 다시 생성)"""
+        self._encoder_threads = [t for t in self._encoder_threads if t.is_alive()]
+        while len(self._encoder_threads) < ENCODER_WORKERS:
+            thread = threading.Thread(target=self.encoder_worker, daemon=True)
+            thread.start()
+            self._encoder_threads.append(thread)
+
+    def stop_encoders(self, timeout=5):
+        """대기열에 남은 이미지를 모두 저장한 뒤 인코더 스레드 종료 (전체 대기 시간은 timeout 이내)"""
+        deadline = time.monotonic() + timeout
+        for _ in self._encoder_threads:
+            try:
+                self._encode_queue.put(None, timeout=max(0, deadline - time.monotonic()))
+            except queue.Full:
+                break
+        for thread in self._encoder_threads:
+            # 스레드마다 timeout을 새로 주지 않고 남은 시간만 대기 (스레드 수만큼 종료가 길어지지 않도록)
+            thread.join(timeout=max(0, deadline - time.monotonic()))
+            if thread.is_alive():
+                self.logger.warning("인코더 스레드가 정상적으로 종료되지 않음")
+        self._encoder_threads = []
+
+    def prepare_frame(self, image, overlay_ts, target_size, grayscale):
+        """저장 전 프레임 처리 (흑백 → 축소 → 시간 오버레이 순서로 처리)"""
+        # 흑백 변환 적용 (Pillow가 C에서 정수 BT.601 가중치로 한 번에 변환)
+        # 변환은 한 번 훑는 가벼운 작업이므로 먼저 해서 더 무거운 축소가 1채널만 처리하게 함
+        if grayscale:
+            try:
+                image = image.convert('L')
+            except MemoryError:
+                self.logger.warning("메모리 부족으로 흑백 변환 실패 - 원본 유지")
+                # 메모리 부족 시 흑백 변환 생략
+            except Exception as e:
+                self.logger.error(f"흑백 변환 중 PIL 에러: {str(e)}")
+                # 변환 실패 시 원본 유지
+
+        # 해상도 조정 적용 (배율 축소는 reduce() 박스 필터로 바로 처리)
+        if isinstance(target_size, int):
+            image = image.reduce(target_size)
+        elif target_size is not None:
+            image = self.resize_image(image, target_size)
+
+        # 현재 시간 오버레이 추가 (최종 해상도/모드에 직접 그려 글자가 축소되지 않음)
+        return self.add_timestamp_overlay(image, overlay_ts)
+
+    def encode_simplejpeg(self, image, quality_value):
+        """simplejpeg로 JPEG 인코딩 (컬러는 4:2:0, 흑백은 단일 채널)"""
+        if image.mode == 'L':
+            pixels = np.asarray(image)[:, :, None]
+            return simplejpeg.encode_jpeg(pixels, quality=quality_value, colorspace='GRAY', fastdct=True)
+        return simplejpeg.encode_jpeg(np.asarray(image), quality=quality_value, colorspace='RGB',
+                                      colorsubsampling='420', fastdct=True)
+
+    def encoder_worker(self):
+        """인코더 스레드 - 대기열의 프레임을 처리한 뒤 선택된 포맷과 품질로 저장 (WebP는 흑백도 손실 압축)"""
+        # 인코딩 버퍼는 스레드마다 하나를 만들어 계속 재사용 (프레임마다 새로 할당하지 않음)
+        buffer = io.BytesIO()
+        while True:
+            job = self._encode_queue.get()
+            if job is None:
+                # 종료 신호
+                break
+
+            (image, filepath, overlay_ts, target_size, grayscale,
+             image_format, quality_value, encode_mode, stats) = job
+            job = None
+            saved = False
+            try:
+                image = self.prepare_frame(image, overlay_ts, target_size, grayscale)
+
+                # 메모리에서 인코딩한 뒤 한 번에 기록 (인코딩 중 작은 write/seek가 파일에 반복되지 않고,
+                # 인코딩이 실패해도 잘린 파일이 남지 않음)
+                # truncate는 메모리를 반환하므로 처음으로 되돌려 덮어쓰고 이번 크기만큼만 기록
+                buffer.seek(0)
+                if image_format == "WEBP":
+                    # 컬러/흑백(L) 모두 선택한 품질로 손실 압축 (method는 인코딩 방식에 따름)
+                    image.save(buffer, "WEBP", quality=quality_value, method=WEBP_METHODS[encode_mode])
+                else:
+                    # optimize(허프만 2회 처리)는 인코딩 시간을 크게 늘리므로 선택한 방식에 따라 적용
+                    if encode_mode == "빠르게":
+                        optimize = False
+                    elif encode_mode == "작게":
+                        optimize = True
+                    else:
+                        # 고품질에서만 의미 있는 용량 감소가 있음
+                        # 흑백(L)은 채널이 하나뿐이라 허프만 최적화 비용이 작으므로 항상 적용
+                        optimize = quality_value >= 85 or image.mode == 'L'
+                    if simplejpeg is not None and not optimize:
+                        # simplejpeg는 허프만 최적화를 지원하지 않으므로 최적화하지 않을 때만 사용
+                        buffer.write(self.encode_simplejpeg(image, quality_value))
+                    else:
+                        # 컬러는 4:2:0 크로마 서브샘플링으로 고정 (-1: 흑백은 Pillow 기본값)
+                        subsampling = 2 if image.mode == 'RGB' else -1
+                        image.save(buffer, "JPEG", quality=quality_value, optimize=optimize,
+                                   subsampling=subsampling, progressive=False)
+
+                # 인코딩이 끝난 프레임은 파일 기록 전에 놓아 줌 (다음 작업을 기다리는 동안 메모리에 남지 않음)
+                image = None
+
+                # 파일명이 고유하므로 자동 삭제와 같은 파일을 다루지 않음
+                size = buffer.tell()
+                with buffer.getbuffer() as view, view[:size] as data:
+                    _write_file(filepath, data)
+
+                # 폴더 크기 누적값 갱신 (기록한 바이트 수를 그대로 사용하여 stat 호출 생략)
+                self.add_folder_size(size)
+                saved = True
+            except (OSError, MemoryError) as e:
+                system_status = self.get_system_status()
+                error_msg = f"이미지 저장 실패: {str(e)}"
+                self.logger.error(f"이미지 저장 실패 ({os.path.basename(filepath)}): {str(e)} [{system_status}]")
+            except Exception as e:
+                error_msg = f"이미지 저장 중 예기치 않은 오류: {str(e)}"
+                self.logger.exception(error_msg)
+            image = None
+
+            # 이 프레임을 넘긴 캡처의 통계에 집계 (정지 후 남은 프레임도 같은 캡처로 셈)
+            failures = stats.done(saved)
+            if not saved and stats is self._save_stats and self.is_capturing:
+                # 디스크 부족, 폴더 삭제/권한 문제 등을 바로 상태 표시에 알림 (정지 후 실패는 최종 결과에 표시)
+                self._post_status(f"{error_msg} (누적 {failures}장)")
+
+    def capture_screen(self, stats):
+        """화면 모니터링 함수 (stats: 이번 캡처의 저장 통계)"""
+        self.start_encoders()
+
+        # 캡처 핸들은 스레드 간 공유할 수 없으므로 캡처 스레드 안에서 생성하고 종료 시 정리
+        camera = None
+        if dxcam is not None and os.name == 'nt':
+            try:
+                # 기본 출력(주 모니터)을 RGB로 캡처
+                camera = dxcam.create(output_color="RGB")
+            except Exception as e:
+                self.logger.warning(f"dxcam 초기화 실패 - mss/PIL ImageGrab 사용: {str(e)}")
+
+        # 핸들은 이 스레드의 지역 세션에만 두어, 정지 직후 다시 시작한 새 캡처 스레드의 핸들과 섞이지 않게 함
+        session = CaptureSession(stats, camera)
+        if camera is None and mss is not None:
+            self._open_mss(session)
+
+        try:
+            self._capture_loop(session)
+        finally:
+            # 캡처 중 핸들을 다시 열었을 수 있으므로 세션에 남은 마지막 핸들을 정리
+            session.close()
+
+    def _open_mss(self, session):
+        """세션의 mss 핸들과 주 모니터 영역을 새로 생성 (실패 시 None으로 두어 PIL ImageGrab 사용)"""
+        if session.sct is not None:
+            session.sct.close()
+        session.sct = session.monitor = None
+        sct = None
+        try:
+            sct = mss.mss()
+            # ImageGrab.grab()과 같이 주 모니터만 캡처 (monitors[0]은 전체 모니터를 합친 영역)
+            session.monitor = sct.monitors[1]
+            session.sct = sct
+        except ScreenShotError as e:
+            if sct is not None:
+                sct.close()
+            self.logger.warning(f"mss 초기화 실패 - PIL ImageGrab 사용: {str(e)}")
+
+    def grab_screen(self, session, reuse_stale=True):
+        """주 모니터 화면 캡처 (dxcam 또는 mss가 있으면 재사용 핸들로 캡처)
+
+        reuse_stale이 False이면 dxcam이 화면 변화 없음을 알릴 때 마지막 프레임 대신 None 반환
+        """
+        camera = session.camera
+        if camera is not None:
+            frame = camera.grab()
+            if frame is None:
+                # 화면 변화가 없으면 새 프레임이 없으므로 마지막 프레임 사용
+                frame = session.last_camera_frame
+                if frame is None:
+                    return ImageGrab.grab()
+                if not reuse_stale:
+                    return None
+            else:
+                session.last_camera_frame = frame
+            # RGB 배열을 새 이미지로 복사하므로 다음 캡처가 같은 배열을 다시 써도 안전함
+            return Image.fromarray(frame)
+        sct = session.sct
+        if sct is None:
+            return ImageGrab.grab()
+        raw = sct.grab(session.monitor)
+        # BGRA 버퍼를 RGB 이미지로 바로 디코딩 (mss의 rgb 변환 단계 생략)
+        # 프레임마다 새 이미지를 만드는 것은 의도된 동작: 이미지는 인코더 대기열로 넘어가
+        # 저장이 끝날 때까지 살아 있으므로 하나의 버퍼를 재사용하면 저장 전 프레임이 덮어써짐
+        return Image.frombuffer('RGB', raw.size, raw.bgra, 'raw', 'BGRX', 0, 1)
+
+    def _wait_next_capture(self, next_deadline, interval):
+        """다음 캡처 예정 시각까지 대기 후 새 예정 시각 반환 (중지 신호가 오면 None)"""
+        next_deadline += interval
+        delay = next_deadline - time.monotonic()
+        if delay < 0:
+            # 이미 지났으면 밀린 캡처를 몰아서 하지 않고 현재 시각부터 다시 계산
+            next_deadline -= delay
+            delay = 0
+        if self.stop_event.wait(delay):
+            return None
+        return next_deadline
+
+    def _capture_loop(self, session):
+        """캡처 반복 실행 (capture_screen에서 호출)"""
+        capture_count = 0  # 인코더에 넘긴 프레임 수 (실제 저장 장수는 stats.saved)
+        stats = session.stats
+        dropped_frames = 0  # 저장이 밀려 버린 프레임 수
+        skipped_frames = 0  # 화면 변화가 없어 저장을 생략한 프레임 수
+        settings = None
+        last_ts_sec = None  # 시간 문자열을 마지막으로 만든 시각 (초)
+        # 다음 캡처 예정 시각 (작업 시간만큼 간격이 밀리지 않도록 기준 시각에 간격을 더해 감)
+        next_deadline = time.monotonic()
+        # 마지막으로 저장한 화면의 지문과 저장 시각 (변경 없는 화면 건너뛰기용)
+        last_fingerprint = None
+        last_saved_at = 0.0
+
         while self.is_capturing and not self.stop_event.is_set():
             try:
+                # 캡처 설정은 메인 스레드가 만든 스냅샷에서 읽음 (이 스레드에서 Tk 변수에 접근하지 않음)
+                if self._capture_settings is not settings:
+                    settings = self._capture_settings
+                    (interval, image_format, active_ext, quality_value,
+                     target_size, grayscale, encode_mode, skip_unchanged) = settings
+
+                # 변경 없는 화면을 건너뛰는 중이고 주기 저장 시점도 아니면
+                # dxcam이 새 프레임이 없다고 알릴 때 지난 프레임을 복사하지 않고 바로 건너뜀
+                heartbeat_due = time.monotonic() - last_saved_at >= UNCHANGED_FRAME_HEARTBEAT_SECONDS
+                reuse_stale = not skip_unchanged or heartbeat_due or last_fingerprint is None
+
                 # 전체 화면 모니터링 (PIL 에러 처리 강화)
                 try:
-                    screenshot = ImageGrab.grab()
-                except (OSError, RuntimeError) as pil_error:
+                    screenshot = self.grab_screen(session, reuse_stale)
+                except (OSError, RuntimeError, ScreenShotError) as pil_error:
                     # PIL 라이브러리 관련 시스템 에러
                     error_msg = f"PIL 화면 캡처 실패: {str(pil_error)}"
                     self.logger.error(error_msg)
-                    self.root.after(0, self.update_status, f"PIL 캡처 에러 - 잠시 후 재시도", capture_count)
-                    time.sleep(3)  # PIL 에러는 더 긴 대기 시간
+                    self._post_status(f"PIL 캡처 에러 - 잠시 후 재시도")
+                    if session.sct is not None:
+                        # 해상도/모니터 구성 변경으로 핸들이나 영역이 더 이상 맞지 않을 수 있으므로 다시 열어 갱신
+                        self._open_mss(session)
+                    self.stop_event.wait(3)  # PIL 에러는 더 긴 대기 시간 (중지 신호 시 즉시 반환)
                     continue
-                
-                # 현재 시간 오버레이 추가
-                screenshot_with_time = self.add_timestamp_overlay(screenshot)
 
-                # 해상도 조정 적용 (thumbnail 사용)
-                if self.image_resolution.get() != "원본":
-                    width, height = map(int, self.image_resolution.get().split('x'))
-                    screenshot_with_time.thumbnail((width, height), Image.LANCZOS)
-
-                # 흑백 변환 적용 (PIL 메모리 최적화)
-                if self.image_grayscale.get():
-                    try:
-                        screenshot_with_time = screenshot_with_time.convert('L')
-                    except MemoryError:
-                        self.logger.warning("메모리 부족으로 흑백 변환 실패 - 원본 유지")
-                        # 메모리 부족 시 흑백 변환 생략
-                    except Exception as e:
-                        self.logger.error(f"흑백 변환 중 PIL 에러: {str(e)}")
-                        # 변환 실패 시 원본 유지
-
-                # 파일명 생성 (타임스탬프 포함)
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]  # 밀리초까지
-                format_ext = "webp" if self.image_format.get() == "WEBP" else "jpg"
-                filename = f"screenshot_{timestamp}.{format_ext}"
-                filepath = os.path.join(self.save_folder, filename)
-
-                # 파일 저장 시 락 획득 (경쟁 상태 방지)
-                with self.file_lock:
-                    # 선택된 포맷과 품질로 저장
-                    quality_value = int(self.image_quality_value.get())
-                    if self.image_format.get() == "WEBP":
-                        screenshot_with_time.save(filepath, "WEBP", quality=quality_value)
+                # 이전에 저장한 화면과 같으면 인코딩/저장 생략 (작게 축소한 이미지의 CRC로 비교)
+                if skip_unchanged:
+                    if screenshot is None:
+                        # dxcam이 새 프레임이 없다고 알림 - 지문 계산 없이 변경 없음으로 처리
+                        fingerprint = last_fingerprint
                     else:
-                        screenshot_with_time.save(filepath, "JPEG", quality=quality_value, optimize=True)
+                        fingerprint = zlib.crc32(screenshot.resize(FRAME_FINGERPRINT_SIZE, Image.BOX).tobytes())
+                    if fingerprint == last_fingerprint and not heartbeat_due:
+                        # 버리는 프레임을 대기 시간 동안 붙잡고 있지 않도록 참조를 먼저 끊음
+                        screenshot = None
+                        skipped_frames += 1
+                        self._post_status(f"화면 변화 없음 - 저장 생략 (누적 {skipped_frames}장)")
+                        next_deadline = self._wait_next_capture(next_deadline, interval)
+                        if next_deadline is None:
+                            break
+                        continue
+                    last_fingerprint = fingerprint
+
+                # 파일명과 오버레이 시간 문자열을 한 번의 시간 측정으로 생성 (strftime/datetime 생성 생략)
+                # 초 단위 부분(저장 경로 포함)은 초가 바뀔 때만 다시 만들고 밀리초와 확장자만 매번 붙임
+                now = time.time()
+                now_sec = int(now)
+                if now_sec != last_ts_sec:
+                    last_ts_sec = now_sec
+                    lt = time.localtime(now_sec)
+                    overlay_ts = (f"{lt.tm_year}-{lt.tm_mon:02d}-{lt.tm_mday:02d} "
+                                  f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}")
+                    path_sec = (f"{self._save_prefix}{lt.tm_year}{lt.tm_mon:02d}{lt.tm_mday:02d}_"
+                                f"{lt.tm_hour:02d}{lt.tm_min:02d}{lt.tm_sec:02d}")
+
+                # 파일 경로 생성 (타임스탬프 포함, 밀리초까지)
+                filepath = f"{path_sec}_{int((now - now_sec) * 1000):03d}{active_ext}"
+
+                # 축소/흑백/오버레이/인코딩/저장은 인코더 스레드에 맡기고 바로 다음 캡처 진행
+                # (대기열이 가득 차면 저장이 캡처를 따라가지 못하는 것이므로 가장 오래된 프레임을 버리고 최신 화면 유지)
+                # 넘긴 뒤에는 참조를 끊어 대기 시간 동안 이 스레드가 프레임을 붙잡고 있지 않게 함
+                job = (screenshot, filepath, overlay_ts, target_size, grayscale,
+                       image_format, quality_value, encode_mode, stats)
+                screenshot = None
+                stats.queued()
+                try:
+                    self._encode_queue.put_nowait(job)
+                except queue.Full:
+                    try:
+                        dropped = self._encode_queue.get_nowait()
+                    except queue.Empty:
+                        # 그 사이 인코더가 대기열을 비움
+                        dropped = None
+                    if dropped is not None:
+                        dropped[8].dropped()
+                        dropped_frames += 1
+                        capture_count -= 1
+                        self.logger.warning(f"이미지 저장 지연으로 이전 프레임 버림: "
+                                            f"{os.path.basename(dropped[1])} (누적 {dropped_frames}장)")
+                    # 캡처 스레드만 대기열에 넣으므로 하나를 꺼낸 뒤에는 반드시 들어감
+                    self._encode_queue.put_nowait(job)
+                job = dropped = None
                 
                 capture_count += 1
+                last_saved_at = time.monotonic()
                 
-                # GUI 업데이트 (메인 스레드에서 실행)
-                self.root.after(0, self.update_status, 
-                               f"캡처 중... ({capture_count}번째)", capture_count)
+                # GUI 업데이트 (최신 상태만 남겨 두면 메인 스레드가 주기적으로 표시 - 프레임마다 이벤트를 쌓지 않음)
+                failures = stats.failures
+                if failures:
+                    # 저장 실패가 있었으면 계속 보이도록 상태 문구에 함께 표시
+                    self._post_status(f"캡처 중... ({capture_count}번째, 저장 실패 {failures}장)")
+                else:
+                    self._post_status(f"캡처 중... ({capture_count}번째)")
                 
-                # 설정된 간격만큼 대기
-                interval = self.capture_interval.get()
-                time.sleep(interval)
+                # 다음 예정 시각까지 대기 (중지 신호가 오면 즉시 종료)
+                next_deadline = self._wait_next_capture(next_deadline, interval)
+                if next_deadline is None:
+                    break
                 
             except OSError as e:
                 # 시스템 리소스 관련 에러
                 system_status = self.get_system_status()
                 error_msg = f"시스템 리소스 오류: {str(e)} [{system_status}]"
                 self.logger.error(error_msg)
-                self.root.after(0, self.update_status, "시스템 리소스 오류 발생 - 잠시 후 재시도", capture_count)
-                time.sleep(2)  # 잠시 대기 후 재시도
+                self._post_status("시스템 리소스 오류 발생 - 잠시 후 재시도")
+                self.stop_event.wait(2)  # 잠시 대기 후 재시도
                 continue
             except MemoryError as e:
                 # 메모리 부족 에러
                 system_status = self.get_system_status()
                 error_msg = f"메모리 부족 오류: {str(e)} [{system_status}]"
                 self.logger.error(error_msg)
-                self.root.after(0, self.update_status, "메모리 부족 - 메모리 정리 후 재시도", capture_count)
+                self._post_status("메모리 부족 - 메모리 정리 후 재시도")
                 gc.collect()  # 메모리 정리 시도
-                time.sleep(5)  # 메모리 회복 대기
+                self.stop_event.wait(5)  # 메모리 회복 대기
                 continue
             except PermissionError as e:
                 # 권한 관련 에러
                 error_msg = f"권한 오류: {str(e)}"
                 self.logger.error(error_msg)
-                self.root.after(0, self.update_status, error_msg, capture_count)
+                self._post_status(error_msg)
                 break
             except Exception as e:
                 # 기타 예기치 않은 에러
                 error_msg = f"예기치 않은 오류: {str(e)}"
                 self.logger.exception(error_msg)
-                self.root.after(0, self.update_status, error_msg, capture_count)
+                self._post_status(error_msg)
                 break
     
+    def _post_status(self, status_text):
+        """캡처/인코더 스레드에서 최신 상태 문구 기록 (Tk 호출 없이 값 하나만 교체)"""
+        self._status_cell = status_text
+
+    def start_status_polling(self):
+        """캡처 상태 표시 주기 갱신 시작 (이전 캡처가 아직 저장 중이어도 이어서 새 캡처를 표시)"""
+        self._status_cell = None
+        self._shown_status = None
+        if self.status_poll_job is None:
+            self.status_poll_job = self.root.after(STATUS_POLL_MS, self.poll_status)
+
+    def stop_status_polling(self):
+        """캡처 상태 표시 주기 갱신 중지"""
+        if self.status_poll_job:
+            self.root.after_cancel(self.status_poll_job)
+            self.status_poll_job = None
+
+    def poll_status(self):
+        """최신 상태 문구나 저장 장수가 바뀌었을 때만 라벨 갱신 (정지 후에는 남은 저장이 끝날 때까지)"""
+        stats = self._save_stats
+        status_text = self._status_cell
+        if not self.is_capturing:
+            # 정지 후: 캡처 스레드가 끝나고 대기열의 프레임까지 모두 처리되면 최종 결과를 표시하고 중지
+            if stats.pending <= 0 and not (self.capture_thread and self.capture_thread.is_alive()):
+                self.status_poll_job = None
+                if stats.failures:
+                    final_text = f"캡처 정지됨 (저장 실패 {stats.failures}장)"
+                else:
+                    final_text = "캡처 정지됨"
+                self.update_status(final_text, stats.saved)
+                return
+            status_text = "캡처 정지 중 - 남은 이미지 저장 중..."
+        if status_text is not None:
+            shown = (status_text, stats.saved)
+            if shown != self._shown_status:
+                self._shown_status = shown
+                self.update_status(*shown)
+        self.status_poll_job = self.root.after(STATUS_POLL_MS, self.poll_status)
+
     def update_status(self, status_text, count):
         """상태 및 카운트 업데이트"""
+        # 다시 그리기는 강제하지 않음 - 메인 루프가 유휴 시점에 두 라벨(및 같은 틱의 다른 변경)을 한 번에 그림
         self.status_label.config(text=status_text)
         self.count_label.config(text=f"캡처된 이미지: {count}개")
     
+    def set_capture_widgets_locked(self, locked):
+        """캡처 중 변경할 수 없는 설정 위젯 잠금/해제"""
+        for widget, locked_state, unlocked_state in self._capture_widgets:
+            widget.config(state=locked_state if locked else unlocked_state)
+
+    def _begin_capture(self, *, silent=False):
+        """캡처 스레드/자동 삭제 시작 및 UI 잠금 (silent: 프로그램 시작 시 자동 시작)"""
+        self.is_capturing = True
+        self.stop_event.clear()  # 중지 신호 초기화
+        # 저장 경로 + 파일명 접두사 (캡처 중에는 경로를 바꿀 수 없으므로 프레임마다 os.path.join 하지 않음)
+        # 기본 경로("screenshots")는 상대 경로이므로 절대 경로로 한 번만 풀어 두어 저장할 때마다 현재 폴더 기준 해석 생략
+        self._save_prefix = os.path.join(os.path.abspath(self.save_folder), SCREENSHOT_PREFIX)
+        self.start_button.config(text="캡처 정지")
+        self.status_label.config(text="자동 캡처 시작됨..." if silent else "캡처 준비 중...")
+
+        # 트레이 메뉴 업데이트
+        self.update_tray_menu()
+
+        # 간격/경로/자동 삭제 설정 비활성화 (캡처 중에는 변경 불가)
+        self.set_capture_widgets_locked(True)
+        # 저장 통계는 캡처마다 새로 만들어, 이전 캡처에서 늦게 끝난 저장이 섞이지 않게 함
+        self._save_stats = SaveStats()
+        self.start_status_polling()
+
+        # 별도 스레드에서 캡처 시작
+        self.capture_thread = threading.Thread(target=self.capture_screen, args=(self._save_stats,),
+                                               daemon=True)
+        self.capture_thread.start()
+
+        # 자동 삭제가 활성화되어 있으면 스레드와 타이머 시작
+        if self.rolling_cleanup_enabled.get():
+            # RollingCleanup 스레드가 없으면 생성
+            if self.rolling_cleanup is None:
+                cleanup_age_value = self.rolling_cleanup_age_value.get()
+                unit = self.rolling_cleanup_age_unit.get()
+                if unit == "분":
+                    cleanup_age_seconds = cleanup_age_value * 60
+                else:  # "시간"
+                    cleanup_age_seconds = cleanup_age_value * 3600
+
+                self.rolling_cleanup = RollingCleanup(
+                    self.save_folder,
+                    self.logger,
+                    self.stop_event,
+                    cleanup_age_seconds,
+                    self.get_active_ext(),
+                    self.add_folder_size
+                )
+            else:
+                self.rolling_cleanup.set_active_ext(self.get_active_ext())
+
+            # RollingCleanup 스레드 시작
+            self.rolling_cleanup.start()
+
+            # UI 타이머도 시작
+            self.start_cleanup_timer()
+
     def start_capture_automatically(self):
         """프로그램 시작 시 자동으로 캡처 시작"""
         try:
@@ -1221,53 +2101,7 @@ class ScreenCapture:
                     return
 
             # 캡처 시작
-            self.is_capturing = True
-            self.stop_event.clear()  # 중지 신호 초기화
-            self.start_button.config(text="캡처 정지")
-            self.status_label.config(text="자동 캡처 시작됨...")
-
-            # 트레이 메뉴 업데이트
-            self.update_tray_menu()
-
-            # 간격 입력 필드 비활성화 (캡처 중에는 변경 불가)
-            self.interval_entry.config(state='readonly')
-            self.apply_button.config(state='disabled')
-
-            # 경로 변경 버튼 비활성화 (캡처 중에는 변경 불가)
-            self.path_button.config(state='disabled')
-
-            # 자동 삭제 설정 비활성화 (캡처 중에는 변경 불가)
-            self.cleanup_checkbox.config(state='disabled')
-            self.cleanup_age_entry.config(state='readonly')
-            self.cleanup_unit_combo.config(state='readonly')
-
-            # 별도 스레드에서 캡처 시작
-            self.capture_thread = threading.Thread(target=self.capture_screen, daemon=True)
-            self.capture_thread.start()
-
-            # 자동 삭제가 활성화되어 있으면 스레드와 타이머 시작
-            if self.rolling_cleanup_enabled.get():
-                # RollingCleanup 스레드가 없으면 생성
-                if self.rolling_cleanup is None:
-                    cleanup_age_value = self.rolling_cleanup_age_value.get()
-                    unit = self.rolling_cleanup_age_unit.get()
-                    if unit == "분":
-                        cleanup_age_seconds = cleanup_age_value * 60
-                    else:  # "시간"
-                        cleanup_age_seconds = cleanup_age_value * 3600
-
-                    self.rolling_cleanup = RollingCleanup(
-                        self.save_folder,
-                        self.logger,
-                        self.stop_event,
-                        cleanup_age_seconds
-                    )
-
-                # RollingCleanup 스레드 시작
-                self.rolling_cleanup.start()
-
-                # UI 타이머도 시작
-                self.start_cleanup_timer()
+            self._begin_capture(silent=True)
 
             self.logger.info("자동 캡처 시작됨")
 
@@ -1294,59 +2128,15 @@ class ScreenCapture:
                     return
 
             # 캡처 시작
-            self.is_capturing = True
-            self.stop_event.clear()  # 중지 신호 초기화
-            self.start_button.config(text="캡처 정지")
-            self.status_label.config(text="캡처 준비 중...")
-
-            # 트레이 메뉴 업데이트
-            self.update_tray_menu()
-
-            # 간격 입력 필드 비활성화 (캡처 중에는 변경 불가)
-            self.interval_entry.config(state='readonly')
-            self.apply_button.config(state='disabled')
-
-            # 경로 변경 버튼 비활성화 (캡처 중에는 변경 불가)
-            self.path_button.config(state='disabled')
-
-            # 자동 삭제 설정 비활성화 (캡처 중에는 변경 불가)
-            self.cleanup_checkbox.config(state='disabled')
-            self.cleanup_age_entry.config(state='readonly')
-            self.cleanup_unit_combo.config(state='readonly')
-
-            # 별도 스레드에서 캡처 시작
-            self.capture_thread = threading.Thread(target=self.capture_screen, daemon=True)
-            self.capture_thread.start()
-
-            # 자동 삭제가 활성화되어 있으면 스레드와 타이머 시작
-            if self.rolling_cleanup_enabled.get():
-                # RollingCleanup 스레드가 없으면 생성
-                if self.rolling_cleanup is None:
-                    cleanup_age_value = self.rolling_cleanup_age_value.get()
-                    unit = self.rolling_cleanup_age_unit.get()
-                    if unit == "분":
-                        cleanup_age_seconds = cleanup_age_value * 60
-                    else:  # "시간"
-                        cleanup_age_seconds = cleanup_age_value * 3600
-
-                    self.rolling_cleanup = RollingCleanup(
-                        self.save_folder,
-                        self.logger,
-                        self.stop_event,
-                        cleanup_age_seconds
-                    )
-
-                # RollingCleanup 스레드 시작
-                self.rolling_cleanup.start()
-
-                # UI 타이머도 시작
-                self.start_cleanup_timer()
-
+            self._begin_capture()
         else:
-            # 캡처 정지
+            # 캡처 정지 (대기 중인 캡처 스레드를 바로 깨움)
             self.is_capturing = False
+            self.stop_event.set()
             self.start_button.config(text="캡처 시작")
-            self.status_label.config(text="캡처 정지됨")
+            # 인코더가 대기열에 남은 프레임을 저장하는 동안 주기 갱신을 계속하고,
+            # 모두 끝나면 poll_status가 최종 장수와 저장 실패를 표시
+            self.status_label.config(text="캡처 정지 중 - 남은 이미지 저장 중...")
 
             # 트레이 메뉴 업데이트
             self.update_tray_menu()
@@ -1360,33 +2150,28 @@ class ScreenCapture:
                 # UI 타이머 중지
                 self.stop_cleanup_timer()
 
-            # 간격 입력 필드 다시 활성화
-            self.interval_entry.config(state='normal')
-            self.apply_button.config(state='normal')
-
-            # 경로 변경 버튼 다시 활성화
-            self.path_button.config(state='normal')
-
-            # 자동 삭제 설정 다시 활성화
-            self.cleanup_checkbox.config(state='normal')
-            self.cleanup_age_entry.config(state='normal')
-            self.cleanup_unit_combo.config(state='normal')
+            # 간격/경로/자동 삭제 설정 다시 활성화
+            self.set_capture_widgets_locked(False)
 
             # 자동 삭제 정보 초기화 (자동 삭제 스레드는 독립적으로 동작)
             # self.next_cleanup_label.config(text="") -> 타이머가 관리하므로 주석 처리
     
     def quit_program(self):
         """프로그램 종료"""
+        # 종료 확인 (취소하면 아무것도 멈추지 않고 그대로 계속 실행)
+        if not messagebox.askokcancel("종료", "프로그램을 종료하시겠습니까?"):
+            return
         self.logger.info("프로그램 종료 시작")
-        
+
+        # 캡처/자동 삭제/리소스 모니터링 스레드가 공유하는 중지 신호를 한 번에 설정
+        # (모든 스레드가 동시에 깨어나므로 아래 join 대기 시간이 합산되지 않음)
+        self.stop_event.set()
+        self.stop_status_polling()
+
         if self.is_capturing:
             # 캡처 중이면 먼저 정지
             self.is_capturing = False
-            self.stop_event.set()  # 스레드 중지 신호 설정
-            self.interval_entry.config(state='normal')  # 입력 필드 다시 활성화
-            self.apply_button.config(state='normal')
-            self.path_button.config(state='normal')  # 경로 버튼 다시 활성화
-            self.cleanup_checkbox.config(state='normal')  # 자동 삭제 체크박스 다시 활성화
+            self.set_capture_widgets_locked(False)  # 입력 위젯 다시 활성화
 
             # 트레이 메뉴 업데이트 (프로그램 종료 전 마지막 업데이트)
             self.update_tray_menu()
@@ -1396,6 +2181,11 @@ class ScreenCapture:
                     self.logger.warning("캡처 스레드가 정상적으로 종료되지 않음")
                 else:
                     self.logger.info("캡처 스레드 정리 완료")
+
+        # 대기열에 남은 이미지 저장 후 인코더 스레드 종료
+        if self._encoder_threads:
+            self.stop_encoders()
+            self.logger.info("인코더 스레드 정리 완료")
         
         # 자동 삭제 스레드 중지
         if self.rolling_cleanup is not None:
@@ -1406,19 +2196,12 @@ class ScreenCapture:
         # 리소스 모니터링 중지
         if self.resource_monitor_enabled.get():
             self.stop_resource_monitoring()
-            if self.resource_monitor_thread and self.resource_monitor_thread.is_alive():
-                # 리소스 모니터링 스레드는 daemon이므로 자동으로 종료됨
-                self.logger.info("리소스 모니터링 스레드 정리 완료")
-        
-        # 종료 확인
-        if messagebox.askokcancel("종료", "프로그램을 종료하시겠습니까?"):
-            self.logger.info("프로그램 종료 확인됨")
 
-            # 시스템 트레이 정리
-            if self.tray_icon:
-                self.tray_icon.stop()
+        # 시스템 트레이 정리
+        if self.tray_icon:
+            self.tray_icon.stop()
 
-            self.root.destroy()
+        self.root.destroy()
 
     def show_startup_message(self):
         """시작 메시지 표시"""